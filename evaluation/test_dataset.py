@@ -4,11 +4,12 @@ This module defines test repositories with known characteristics
 for evaluating agent performance.
 """
 
-from dataclasses import dataclass
-from typing import List, Dict, Any
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Tuple
 from datetime import datetime, timedelta
 
 
+
 @dataclass
 class ExpectedSuggestion:
     """Expected suggestion for a test repository."""
@@ -18,6 +19,19 @@ class ExpectedSuggestion:
     description_keywords: List[str]  # Keywords that should appear in description
     priority: str
     min_priority_score: float = 0.0  # Minimum acceptable priority score
+    _title_kw: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _desc_kw: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Casefold the keyword lists once so matching does no per-call work."""
+        self._title_kw = tuple(k.casefold() for k in self.title_keywords)
+        self._desc_kw = tuple(k.casefold() for k in self.description_keywords)
+    
+    @staticmethod
+    def _has_keyword(text: str, keywords: Tuple[str, ...]) -> bool:
+        """Check whether any keyword occurs in text, ignoring case."""
+        text = text.casefold()
+        return any(keyword in text for keyword in keywords)
     
     def matches(self, suggestion: Any) -> bool:
         """Check if a suggestion matches this expected suggestion.
@@ -33,13 +47,11 @@ class ExpectedSuggestion:
             return False
         
         # Check title keywords
-        title_lower = suggestion.title.lower()
-        if not any(keyword.lower() in title_lower for keyword in self.title_keywords):
+        if not self._has_keyword(suggestion.title, self._title_kw):
             return False
         
         # Check description keywords
-        desc_lower = suggestion.description.lower()
-        if not any(keyword.lower() in desc_lower for keyword in self.description_keywords):
+        if not self._has_keyword(suggestion.description, self._desc_kw):
             return False
         
         return True
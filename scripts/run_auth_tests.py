@@ -1,4 +1,9 @@
-"""Simple test runner for authentication tests."""
+"""Simple test runner for authentication tests.
+
+Runs the auth and config test modules through pytest with the cache and
+doctest plugins disabled. Set FAST_TESTS=1 to also skip setuptools plugin
+autoloading, which dominates start-up time for these short modules.
+"""
 
 import sys
 import os
@@ -9,67 +14,41 @@ if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
-# Add current directory to path
-sys.path.insert(0, os.path.dirname(__file__))
+# Add project root to path
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
 
 # Set environment variables for testing
 os.environ['GITHUB_TOKEN'] = 'ghp_' + 'x' * 36
 os.environ['GEMINI_API_KEY'] = 'test_key_1234567890'
 
-from tests.test_auth import (
-    TestTokenValidationResult,
-    TestAuthenticationManager,
-    TestValidateStartupCredentials,
-    TestTokenSecurityAudit
-)
+# Plugin autoloading happens when pytest starts, so this must be set before
+# pytest.main() runs; a conftest.py would be loaded too late to affect it.
+if os.environ.get('FAST_TESTS') == '1':
+    os.environ.setdefault('PYTEST_DISABLE_PLUGIN_AUTOLOAD', '1')
+
+import pytest
+
+TEST_MODULES = [
+    os.path.join(PROJECT_ROOT, 'tests', 'test_auth.py'),
+    os.path.join(PROJECT_ROOT, 'tests', 'test_config.py'),
+]
+
 
 def run_tests():
     """Run all authentication tests."""
     print("Running Authentication Tests...")
     print("=" * 80)
-    
-    test_classes = [
-        TestTokenValidationResult,
-        TestAuthenticationManager,
-        TestValidateStartupCredentials,
-        TestTokenSecurityAudit
-    ]
-    
-    total_tests = 0
-    passed_tests = 0
-    failed_tests = 0
-    
-    for test_class in test_classes:
-        print(f"\n{test_class.__name__}:")
-        print("-" * 80)
-        
-        # Get all test methods
-        test_methods = [m for m in dir(test_class) if m.startswith('test_')]
-        
-        for method_name in test_methods:
-            total_tests += 1
-            test_instance = test_class()
-            
-            try:
-                # Run setup if exists
-                if hasattr(test_instance, 'setup_method'):
-                    test_instance.setup_method()
-                
-                # Run test
-                method = getattr(test_instance, method_name)
-                method()
-                
-                print(f"  ✓ {method_name}")
-                passed_tests += 1
-                
-            except Exception as e:
-                print(f"  ✗ {method_name}: {str(e)}")
-                failed_tests += 1
-    
-    print("\n" + "=" * 80)
-    print(f"Total: {total_tests} | Passed: {passed_tests} | Failed: {failed_tests}")
-    
-    return failed_tests == 0
+
+    exit_code = pytest.main([
+        '-p', 'no:cacheprovider',
+        '-p', 'no:doctest',
+        '--import-mode=importlib',
+        '--rootdir', PROJECT_ROOT,
+        *TEST_MODULES,
+    ])
+
+    return exit_code == 0
 
 if __name__ == '__main__':
     success = run_tests()
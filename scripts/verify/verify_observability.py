@@ -21,9 +21,11 @@ m.record_token_usage('gemini', 1000, 500)
 # Get summary
 summary = m.get_session_summary()
 
-print("SUCCESS: MetricsCollector is working!")
-print(f"  Repos analyzed: {summary['usage']['repos_analyzed']}")
-print(f"  Suggestions: {summary['usage']['suggestions_generated']}")
-print(f"  Issues created: {summary['usage']['issues_created']}")
-print(f"  Total tokens: {summary['cost']['total_tokens_used']}")
-print(f"  GitHub API calls: {summary['cost']['github_api_calls']}")
+print("\n".join([
+    "SUCCESS: MetricsCollector is working!",
+    f"  Repos analyzed: {summary['usage']['repos_analyzed']}",
+    f"  Suggestions: {summary['usage']['suggestions_generated']}",
+    f"  Issues created: {summary['usage']['issues_created']}",
+    f"  Total tokens: {summary['cost']['total_tokens_used']}",
+    f"  GitHub API calls: {summary['cost']['github_api_calls']}",
+]))
@@ -7,9 +7,10 @@ prioritizes suggestions, handles deduplication, and creates GitHub issues.
 import logging
 import time
 from typing import List, Optional
-from datetime import datetime
 import json
 import hashlib
+import itertools
+import secrets
 
 import google.generativeai as genai
 
@@ -24,6 +25,33 @@ from ..observability import get_metrics_collector
 
 logger = logging.getLogger(__name__)
 
+# Suggestion IDs end in a per-process salt plus a counter, which keeps them
+# unique across runs without reading the clock for every suggestion
+_SUGGESTION_ID_SALT = secrets.token_hex(4)
+_suggestion_id_counter = itertools.count()
+
+# Scores used to prioritize suggestions
+PRIORITY_SCORES = {"high": 3, "medium": 2, "low": 1}
+EFFORT_SCORES = {"small": 3, "medium": 2, "large": 1}
+CATEGORY_SCORES = {
+    "security": 5,
+    "bug": 4,
+    "enhancement": 3,
+    "documentation": 2,
+    "refactor": 1
+}
+
+
+def _suggestion_score(suggestion: MaintenanceSuggestion) -> int:
+    """Calculate priority score for a suggestion."""
+    priority = PRIORITY_SCORES.get(suggestion.priority, 1)
+    effort = EFFORT_SCORES.get(suggestion.estimated_effort, 1)
+    category = CATEGORY_SCORES.get(suggestion.category, 1)
+    
+    # Score = (priority + category * 2) * effort
+    # Higher priority and category, lower effort = higher score
+    return (priority + category * 2) * effort
+
 
 class MaintainerAgent:
     """Agent responsible for generating maintenance suggestions and creating issues."""
@@ -75,11 +103,12 @@ class MaintainerAgent:
         )
         
         all_suggestions = []
+        excluded_repos = frozenset(user_preferences.excluded_repos) if user_preferences else frozenset()
         
         for profile in profiles:
             try:
                 # Skip excluded repositories
-                if user_preferences and profile.repository.full_name in user_preferences.excluded_repos:
+                if profile.repository.full_name in excluded_repos:
                     logger.info(
                         f"Skipping excluded repository: {profile.repository.full_name}",
                         extra={
@@ -100,12 +129,10 @@ class MaintainerAgent:
                 )
                 
                 # Record metrics for each suggestion
-                for suggestion in unique_suggestions:
-                    metrics.record_suggestion_generated(
-                        profile.repository.full_name,
-                        suggestion.category,
-                        suggestion.priority
-                    )
+                metrics.record_batch(
+                    ('suggestion', (profile.repository.full_name, s.category, s.priority))
+                    for s in unique_suggestions
+                )
                 
                 all_suggestions.extend(unique_suggestions)
                 
@@ -483,31 +510,10 @@ Respond with ONLY the JSON object, no additional text."""
         """
         logger.info(f"Prioritizing {len(suggestions)} suggestions")
         
-        # Define priority scores
-        priority_scores = {"high": 3, "medium": 2, "low": 1}
-        effort_scores = {"small": 3, "medium": 2, "large": 1}
-        category_scores = {
-            "security": 5,
-            "bug": 4,
-            "enhancement": 3,
-            "documentation": 2,
-            "refactor": 1
-        }
-        
-        def calculate_score(suggestion: MaintenanceSuggestion) -> float:
-            """Calculate priority score for a suggestion."""
-            priority = priority_scores.get(suggestion.priority, 1)
-            effort = effort_scores.get(suggestion.estimated_effort, 1)
-            category = category_scores.get(suggestion.category, 1)
-            
-            # Score = (priority + category * 2) * effort
-            # Higher priority and category, lower effort = higher score
-            return (priority + category * 2) * effort
-        
         # Sort by score (descending)
         sorted_suggestions = sorted(
             suggestions,
-            key=calculate_score,
+            key=_suggestion_score,
             reverse=True
         )
         
@@ -531,12 +537,14 @@ Respond with ONLY the JSON object, no additional text."""
         """
         # Load existing suggestions from memory
         existing_suggestions = self.memory_bank.load_suggestions(repo_full_name)
-        existing_titles = {s.title.lower() for s in existing_suggestions}
+        seen_titles = {s.title.strip().lower() for s in existing_suggestions}
         
-        # Filter out duplicates
+        # Filter out duplicates, including repeats within this batch
         unique_suggestions = []
         for suggestion in suggestions:
-            if suggestion.title.lower() not in existing_titles:
+            title_key = suggestion.title.strip().lower()
+            if title_key not in seen_titles:
+                seen_titles.add(title_key)
                 unique_suggestions.append(suggestion)
             else:
                 logger.debug(f"Skipping duplicate suggestion: {suggestion.title}")
@@ -631,7 +639,8 @@ Respond with ONLY the JSON object, no additional text."""
         Returns:
             Unique suggestion ID
         """
-        # Create hash from repo name, title, and timestamp
-        content = f"{repo_full_name}:{title}:{datetime.now().isoformat()}"
-        hash_obj = hashlib.sha256(content.encode())
-        return hash_obj.hexdigest()[:16]
+        digest = hashlib.blake2b(
+            f"{repo_full_name}\x00{title}".encode(),
+            digest_size=8
+        ).hexdigest()
+        return f"{digest}-{_SUGGESTION_ID_SALT}{next(_suggestion_id_counter):x}"
@@ -4,7 +4,7 @@ This module provides secure credential management, token validation,
 and authentication utilities for GitHub API access.
 """
 
-import os
+import re
 import logging
 from typing import Optional, Tuple
 from dataclasses import dataclass
@@ -14,6 +14,14 @@ from .config import Config
 
 logger = logging.getLogger(__name__)
 
+# Patterns for GitHub tokens
+_TOKEN_RE = re.compile(
+    r'ghp_[a-zA-Z0-9]{36,}'
+    r'|gho_[a-zA-Z0-9]{36,}'
+    r'|ghs_[a-zA-Z0-9]{36,}'
+    r'|github_pat_[a-zA-Z0-9_]{82}'
+)
+
 
 @dataclass
 class TokenValidationResult:
@@ -36,6 +44,7 @@ class AuthenticationManager:
         """
         self.config = config
         self._github_client: Optional[GitHubClient] = None
+        self._user_cache: Optional[dict] = None
     
     def validate_github_token(self) -> TokenValidationResult:
         """Validate GitHub token by making an authenticated API call.
@@ -77,8 +86,7 @@ class AuthenticationManager:
         
         # Validate by making an API call
         try:
-            client = GitHubClient(token=token)
-            user_data = client.get('/user')
+            user_data = self._fetch_user()
             
             username = user_data.get('login')
             logger.info(f"GitHub token validated successfully for user: {username}")
@@ -138,6 +146,16 @@ class AuthenticationManager:
         logger.info("All credentials validated successfully")
         return True, None
     
+    def _fetch_user(self) -> dict:
+        """Fetch the authenticated user, calling /user at most once per manager.
+        
+        Returns:
+            dict: User data returned by the GitHub API
+        """
+        if self._user_cache is None:
+            self._user_cache = self.get_github_client().get('/user')
+        return self._user_cache
+    
     def get_github_client(self) -> GitHubClient:
         """Get or create a GitHub client instance.
         
@@ -174,21 +192,10 @@ class AuthenticationManager:
         Returns:
             bool: True if text appears to contain a token
         """
-        import re
-        
-        # Patterns for GitHub tokens
-        token_patterns = [
-            r'ghp_[a-zA-Z0-9]{36,}',
-            r'gho_[a-zA-Z0-9]{36,}',
-            r'ghs_[a-zA-Z0-9]{36,}',
-            r'github_pat_[a-zA-Z0-9_]{82}',
-        ]
-        
-        for pattern in token_patterns:
-            if re.search(pattern, text):
-                return True
-        
-        return False
+        # Every token prefix contains an underscore; reject without the regex
+        if '_' not in text:
+            return False
+        return _TOKEN_RE.search(text) is not None
 
 
 def validate_startup_credentials(config: Config) -> Tuple[bool, Optional[str]]:
@@ -10,9 +10,13 @@ from typing import Optional
 from dotenv import load_dotenv
 
 
-@dataclass
+@dataclass(frozen=True)
 class Config:
-    """Application configuration loaded from environment variables."""
+    """Application configuration loaded from environment variables.
+    
+    Instances are immutable and hashable; use ``dataclasses.replace`` to
+    derive a variant.
+    """
     
     github_token: str
     gemini_api_key: str
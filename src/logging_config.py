@@ -6,12 +6,18 @@ credential sanitization to ensure secure logging practices.
 
 import logging
 import json
+import math
 import re
-from datetime import datetime
+from collections import deque
+from datetime import date, datetime, time
 from typing import Any, Dict, Optional
 from logging import LogRecord
 
 
+# Leaf types that can never hold a credential
+_SCALAR_TYPES = frozenset({int, float, bool, type(None)})
+
+
 class CredentialSanitizer:
     """Sanitizes sensitive information from log messages."""
     
@@ -25,6 +31,23 @@ class CredentialSanitizer:
         re.compile(r'Bearer\s+[a-zA-Z0-9\-._~+/]+=*'),  # Bearer tokens
     ]
     
+    # All patterns fused into one alternation so a message is scanned once
+    COMBINED_PATTERN = re.compile('|'.join(p.pattern for p in TOKEN_PATTERNS))
+    
+    # Literal prefix of each pattern above, in the same order; messages
+    # containing none of them cannot match, so they skip the regex entirely
+    TOKEN_PREFIXES = ('ghp_', 'gho_', 'ghs_', 'github_pat_', 'AIza', 'Bearer')
+    PREFIX_PATTERNS = tuple(zip(TOKEN_PREFIXES, TOKEN_PATTERNS))
+    
+    # Dictionary keys whose values are always redacted
+    SENSITIVE_KEYS = frozenset({'token', 'api_key', 'password', 'secret', 'authorization'})
+    # Prefixed variants such as github_token or gemini_api_key, matched by a
+    # single str.endswith call over the whole tuple
+    SENSITIVE_KEY_SUFFIXES = tuple('_' + key for key in sorted(SENSITIVE_KEYS))
+    
+    # Placeholder for a container nested inside itself
+    CIRCULAR = '[Circular]'
+    
     @classmethod
     def sanitize(cls, text: str) -> str:
         """Remove sensitive tokens from text.
@@ -37,42 +60,116 @@ class CredentialSanitizer:
         """
         if not isinstance(text, str):
             return text
-        sanitized = text
-        for pattern in cls.TOKEN_PATTERNS:
-            sanitized = pattern.sub('[REDACTED]', sanitized)
-        return sanitized
+        # str containment is a C-level fast search, far cheaper than the regex
+        hits = [pattern for prefix, pattern in cls.PREFIX_PATTERNS if prefix in text]
+        if not hits:
+            return text
+        if len(hits) == 1:
+            return hits[0].sub('[REDACTED]', text)
+        return cls.COMBINED_PATTERN.sub('[REDACTED]', text)
     
     @classmethod
     def sanitize_dict(cls, data: Dict[str, Any]) -> Dict[str, Any]:
         """Recursively sanitize a dictionary.
         
+        A dict or list nested inside itself is replaced by CIRCULAR where it
+        repeats, so self-referencing data cannot loop forever.
+        
         Args:
             data: Dictionary that may contain sensitive information
             
         Returns:
             dict: Dictionary with sensitive values redacted
         """
+        sanitize = cls.sanitize
+        sensitive_keys = cls.SENSITIVE_KEYS
+        sensitive_suffixes = cls.SENSITIVE_KEY_SUFFIXES
+        circular = cls.CIRCULAR
         sanitized = {}
-        for key, value in data.items():
-            # Redact known sensitive keys
-            if key.lower() in ('token', 'api_key', 'password', 'secret', 'authorization'):
-                sanitized[key] = '[REDACTED]'
-            elif isinstance(value, str):
-                sanitized[key] = cls.sanitize(value)
-            elif isinstance(value, dict):
-                sanitized[key] = cls.sanitize_dict(value)
-            elif isinstance(value, list):
-                sanitized[key] = [
-                    cls.sanitize_dict(item) if isinstance(item, dict)
-                    else cls.sanitize(item) if isinstance(item, str)
-                    else item
-                    for item in value
-                ]
-            else:
-                sanitized[key] = value
+        # Walk nested dicts with a worklist of (source, destination, ancestor
+        # ids) entries instead of recursing; each destination is filled in
+        # place, and a dict that contains itself is cut off at the cycle
+        stack = deque([(data, sanitized, frozenset((id(data),)))])
+        while stack:
+            source, dest, ancestors = stack.popleft()
+            for key, value in source.items():
+                # Redact known sensitive keys
+                lowered = key.lower()
+                if lowered in sensitive_keys or lowered.endswith(sensitive_suffixes):
+                    dest[key] = '[REDACTED]'
+                elif type(value) in _SCALAR_TYPES:
+                    # Numeric and boolean leaves pass through with one lookup
+                    dest[key] = value
+                elif isinstance(value, str):
+                    dest[key] = sanitize(value)
+                elif isinstance(value, dict):
+                    if id(value) in ancestors:
+                        dest[key] = circular
+                    else:
+                        child = dest[key] = {}
+                        stack.append((value, child, ancestors | {id(value)}))
+                elif isinstance(value, list):
+                    items = dest[key] = []
+                    for item in value:
+                        if isinstance(item, dict):
+                            if id(item) in ancestors:
+                                items.append(circular)
+                                continue
+                            child = {}
+                            items.append(child)
+                            stack.append((item, child, ancestors | {id(item)}))
+                        elif isinstance(item, str):
+                            items.append(sanitize(item))
+                        elif item is value:
+                            items.append(circular)
+                        else:
+                            items.append(item)
+                else:
+                    dest[key] = value
         return sanitized
 
 
+# C-accelerated JSON string escaping from the stdlib encoder
+_encode_str = json.encoder.encode_basestring_ascii
+
+# Context attributes copied verbatim from the record when present
+_CONTEXT_FIELDS = ('agent', 'event', 'session_id', 'repository')
+
+
+def _finite(value: Any) -> Any:
+    """Copy a JSON-like value with NaN and infinities replaced by None."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite(item) for item in value]
+    return value
+
+
+def _json_default(value: Any) -> str:
+    """Render values json can't serialize: ISO 8601 for dates and times, str otherwise."""
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    return str(value)
+
+
+def _dumps(value: Any) -> str:
+    """Serialize a value to compact JSON.
+    
+    Values json has no encoding for (datetimes, UUIDs, ...) go through
+    _json_default, and non-finite floats are written as null, so a log record
+    is never lost to a TypeError or written as invalid JSON.
+    """
+    if isinstance(value, str):
+        return _encode_str(value)
+    try:
+        return json.dumps(value, separators=(',', ':'), allow_nan=False, default=_json_default)
+    except ValueError:
+        # NaN and infinities are not valid JSON
+        return json.dumps(_finite(value), separators=(',', ':'), default=_json_default)
+
+
 class StructuredFormatter(logging.Formatter):
     """JSON formatter for structured logging."""
     
@@ -85,33 +182,32 @@ class StructuredFormatter(logging.Formatter):
         Returns:
             str: JSON-formatted log entry
         """
-        log_data = {
-            'timestamp': datetime.utcnow().isoformat() + 'Z',
-            'level': record.levelname,
-            'logger': record.name,
-            'message': CredentialSanitizer.sanitize(record.getMessage()),
-        }
+        # The schema is fixed, so the JSON object is written directly rather
+        # than building a dict and serializing it
+        parts = [
+            '{"timestamp":"', datetime.utcnow().isoformat(), 'Z"',
+            ',"level":', _encode_str(record.levelname),
+            ',"logger":', _encode_str(record.name),
+            ',"message":', _encode_str(CredentialSanitizer.sanitize(record.getMessage())),
+        ]
         
         # Add extra fields if present
-        if hasattr(record, 'agent'):
-            log_data['agent'] = record.agent
-        if hasattr(record, 'event'):
-            log_data['event'] = record.event
-        if hasattr(record, 'session_id'):
-            log_data['session_id'] = record.session_id
-        if hasattr(record, 'repository'):
-            log_data['repository'] = record.repository
-        if hasattr(record, 'metrics'):
-            log_data['metrics'] = CredentialSanitizer.sanitize_dict(record.metrics)
-        if hasattr(record, 'extra_data'):
-            log_data['data'] = CredentialSanitizer.sanitize_dict(record.extra_data)
+        fields = record.__dict__
+        for name in _CONTEXT_FIELDS:
+            if name in fields:
+                parts.append(f',"{name}":{_dumps(fields[name])}')
+        if 'metrics' in fields:
+            parts.append(f',"metrics":{_dumps(CredentialSanitizer.sanitize_dict(record.metrics))}')
+        if 'extra_data' in fields:
+            parts.append(f',"data":{_dumps(CredentialSanitizer.sanitize_dict(record.extra_data))}')
         
         # Add exception info if present
         if record.exc_info:
-            log_data['exception'] = self.formatException(record.exc_info)
-            log_data['exception'] = CredentialSanitizer.sanitize(log_data['exception'])
+            exception = CredentialSanitizer.sanitize(self.formatException(record.exc_info))
+            parts.append(f',"exception":{_encode_str(exception)}')
         
-        return json.dumps(log_data)
+        parts.append('}')
+        return ''.join(parts)
 
 
 def setup_logging(log_level: str = "INFO") -> None:
@@ -2,8 +2,11 @@
 
 from .session_service import SessionService
 from .memory_bank import MemoryBank
+from .backends import DictBackend, FileBackend
 
 __all__ = [
     "SessionService",
     "MemoryBank",
+    "DictBackend",
+    "FileBackend",
 ]
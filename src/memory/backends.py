@@ -0,0 +1,91 @@
+"""Storage backends used by the memory bank."""
+
+import shutil
+from pathlib import Path
+from typing import Dict, List
+
+
+class FileBackend:
+    """Stores memory bank documents as files on disk."""
+    
+    def read_text(self, path: Path) -> str:
+        """Read a document."""
+        return path.read_text(encoding='utf-8')
+    
+    def write_text(self, path: Path, data: str) -> None:
+        """Write a document, replacing any existing content."""
+        path.write_text(data, encoding='utf-8')
+    
+    def exists(self, path: Path) -> bool:
+        """Check whether a document exists."""
+        return path.exists()
+    
+    def unlink(self, path: Path) -> None:
+        """Delete a document."""
+        path.unlink()
+    
+    def list_dir(self, directory: Path, suffix: str) -> List[Path]:
+        """List documents directly inside a directory with the given suffix."""
+        if not directory.exists():
+            return []
+        return list(directory.glob(f"*{suffix}"))
+    
+    def make_dirs(self, *directories: Path) -> None:
+        """Create directories if they don't exist."""
+        for directory in directories:
+            directory.mkdir(parents=True, exist_ok=True)
+    
+    def remove_tree(self, directory: Path) -> None:
+        """Delete a directory and everything under it."""
+        try:
+            shutil.rmtree(directory)
+        except FileNotFoundError:
+            pass
+
+
+class DictBackend:
+    """Keeps memory bank documents in a dictionary; nothing touches the disk.
+    
+    Useful for tests and short-lived runs where persistence is not needed.
+    """
+    
+    def __init__(self):
+        """Initialize an empty in-memory store."""
+        self.documents: Dict[Path, str] = {}
+    
+    def read_text(self, path: Path) -> str:
+        """Read a document."""
+        try:
+            return self.documents[path]
+        except KeyError:
+            raise FileNotFoundError(str(path)) from None
+    
+    def write_text(self, path: Path, data: str) -> None:
+        """Write a document, replacing any existing content."""
+        self.documents[path] = data
+    
+    def exists(self, path: Path) -> bool:
+        """Check whether a document exists."""
+        return path in self.documents
+    
+    def unlink(self, path: Path) -> None:
+        """Delete a document."""
+        try:
+            del self.documents[path]
+        except KeyError:
+            raise FileNotFoundError(str(path)) from None
+    
+    def list_dir(self, directory: Path, suffix: str) -> List[Path]:
+        """List documents directly inside a directory with the given suffix."""
+        return [
+            path for path in self.documents
+            if path.parent == directory and path.suffix == suffix
+        ]
+    
+    def make_dirs(self, *directories: Path) -> None:
+        """Directories are implicit in the key paths, so nothing to create."""
+    
+    def remove_tree(self, directory: Path) -> None:
+        """Delete every document under a directory."""
+        for path in [p for p in self.documents if directory in p.parents]:
+            del self.documents[path]
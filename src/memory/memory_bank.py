@@ -3,31 +3,58 @@
 import json
 import os
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used without it
+    orjson = None
+
 from ..models import RepositoryProfile, UserPreferences, MaintenanceSuggestion
+from .backends import DictBackend, FileBackend
+
+
+def _dumps(data: Any) -> str:
+    """Serialize a document to indented JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
+
+def _loads(text: str) -> Any:
+    """Parse a JSON document, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
 
 
 class MemoryBank:
     """Manages long-term storage of repository profiles, user preferences, and suggestions."""
     
-    def __init__(self, storage_dir: str = ".github_maintainer_memory"):
+    def __init__(
+        self,
+        storage_dir: str = ".github_maintainer_memory",
+        backend: Optional[Union[FileBackend, DictBackend]] = None
+    ):
         """
         Initialize the memory bank with a storage directory.
         
         Args:
             storage_dir: Directory path for storing memory files
+            backend: Storage backend (defaults to FileBackend, i.e. files on disk)
         """
         self.storage_dir = Path(storage_dir)
+        self.backend = backend or FileBackend()
         self._ensure_storage_structure()
     
     def _ensure_storage_structure(self) -> None:
         """Create storage directory structure if it doesn't exist."""
-        self.storage_dir.mkdir(parents=True, exist_ok=True)
-        (self.storage_dir / "profiles").mkdir(exist_ok=True)
-        (self.storage_dir / "preferences").mkdir(exist_ok=True)
-        (self.storage_dir / "suggestions").mkdir(exist_ok=True)
+        self.backend.make_dirs(
+            self.storage_dir / "profiles",
+            self.storage_dir / "preferences",
+            self.storage_dir / "suggestions",
+        )
     
     def _get_profile_path(self, repo_full_name: str) -> Path:
         """Get the file path for a repository profile."""
@@ -60,8 +87,7 @@ class MemoryBank:
         
         profile_path = self._get_profile_path(profile.repository.full_name)
         
-        with open(profile_path, 'w', encoding='utf-8') as f:
-            json.dump(profile.to_dict(), f, indent=2)
+        self.backend.write_text(profile_path, _dumps(profile.to_dict()))
     
     def load_repository_profile(self, repo_full_name: str) -> Optional[RepositoryProfile]:
         """
@@ -75,12 +101,11 @@ class MemoryBank:
         """
         profile_path = self._get_profile_path(repo_full_name)
         
-        if not profile_path.exists():
+        if not self.backend.exists(profile_path):
             return None
         
         try:
-            with open(profile_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _loads(self.backend.read_text(profile_path))
             return RepositoryProfile.from_dict(data)
         except (json.JSONDecodeError, KeyError, ValueError) as e:
             # Log error but don't crash - return None for corrupted data
@@ -99,8 +124,8 @@ class MemoryBank:
         """
         profile_path = self._get_profile_path(repo_full_name)
         
-        if profile_path.exists():
-            profile_path.unlink()
+        if self.backend.exists(profile_path):
+            self.backend.unlink(profile_path)
             return True
         return False
     
@@ -112,11 +137,9 @@ class MemoryBank:
             List of repository full names
         """
         profiles_dir = self.storage_dir / "profiles"
-        if not profiles_dir.exists():
-            return []
         
         profiles = []
-        for file_path in profiles_dir.glob("*.json"):
+        for file_path in self.backend.list_dir(profiles_dir, ".json"):
             # Convert filename back to repo full name
             repo_name = file_path.stem.replace("_", "/")
             profiles.append(repo_name)
@@ -139,8 +162,7 @@ class MemoryBank:
         
         prefs_path = self._get_preferences_path(preferences.user_id)
         
-        with open(prefs_path, 'w', encoding='utf-8') as f:
-            json.dump(preferences.to_dict(), f, indent=2)
+        self.backend.write_text(prefs_path, _dumps(preferences.to_dict()))
     
     def load_user_preferences(self, user_id: str) -> Optional[UserPreferences]:
         """
@@ -154,12 +176,11 @@ class MemoryBank:
         """
         prefs_path = self._get_preferences_path(user_id)
         
-        if not prefs_path.exists():
+        if not self.backend.exists(prefs_path):
             return None
         
         try:
-            with open(prefs_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _loads(self.backend.read_text(prefs_path))
             return UserPreferences.from_dict(data)
         except (json.JSONDecodeError, KeyError, ValueError) as e:
             print(f"Warning: Failed to load preferences for {user_id}: {e}")
@@ -177,8 +198,8 @@ class MemoryBank:
         """
         prefs_path = self._get_preferences_path(user_id)
         
-        if prefs_path.exists():
-            prefs_path.unlink()
+        if self.backend.exists(prefs_path):
+            self.backend.unlink(prefs_path)
             return True
         return False
     
@@ -206,8 +227,7 @@ class MemoryBank:
         # Serialize all suggestions
         suggestions_data = [s.to_dict() for s in all_suggestions]
         
-        with open(suggestions_path, 'w', encoding='utf-8') as f:
-            json.dump(suggestions_data, f, indent=2)
+        self.backend.write_text(suggestions_path, _dumps(suggestions_data))
     
     def load_suggestions(self, repo_full_name: str) -> List[MaintenanceSuggestion]:
         """
@@ -221,12 +241,11 @@ class MemoryBank:
         """
         suggestions_path = self._get_suggestions_path(repo_full_name)
         
-        if not suggestions_path.exists():
+        if not self.backend.exists(suggestions_path):
             return []
         
         try:
-            with open(suggestions_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _loads(self.backend.read_text(suggestions_path))
             return [MaintenanceSuggestion.from_dict(s) for s in data]
         except (json.JSONDecodeError, KeyError, ValueError) as e:
             print(f"Warning: Failed to load suggestions for {repo_full_name}: {e}")
@@ -263,14 +282,12 @@ class MemoryBank:
         """
         suggestions_path = self._get_suggestions_path(repo_full_name)
         
-        if suggestions_path.exists():
-            suggestions_path.unlink()
+        if self.backend.exists(suggestions_path):
+            self.backend.unlink(suggestions_path)
             return True
         return False
     
     def clear_all_data(self) -> None:
         """Clear all data from memory bank (use with caution)."""
-        import shutil
-        if self.storage_dir.exists():
-            shutil.rmtree(self.storage_dir)
+        self.backend.remove_tree(self.storage_dir)
         self._ensure_storage_structure()
@@ -6,8 +6,10 @@ from typing import List
 import json
 
 from .repository import Repository
+from ..slots import slotted
 
 
+@slotted
 @dataclass
 class HealthSnapshot:
     """Repository health assessment."""
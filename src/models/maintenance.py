@@ -5,8 +5,10 @@ from typing import List
 import json
 
 from .repository import Repository
+from ..slots import slotted
 
 
+@slotted
 @dataclass
 class MaintenanceSuggestion:
     """Actionable maintenance task."""
@@ -5,21 +5,53 @@ throughout the agent workflow, including performance, usage, quality, and cost m
 """
 
 import time
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, Deque, Iterable, Tuple
 from datetime import datetime
 from dataclasses import dataclass, field, asdict
-from collections import defaultdict
+from collections import defaultdict, deque
 import threading
 
+from .slots import slotted
 
+# Most recent per-event metrics kept for inspection; aggregates cover the whole session
+MAX_METRIC_HISTORY = 10000
+
+
+def _datetime_ns(timestamp_ns: int) -> datetime:
+    """Convert a time.time_ns() value to a local datetime (microsecond precision)."""
+    seconds, nanoseconds = divmod(timestamp_ns, 1_000_000_000)
+    return datetime.fromtimestamp(seconds).replace(microsecond=nanoseconds // 1000)
+
+
+def _isoformat_ns(timestamp_ns: int) -> str:
+    """Format a time.time_ns() value as a local ISO 8601 timestamp."""
+    return _datetime_ns(timestamp_ns).isoformat()
+
+
+class _Timestamped:
+    """Mixin exposing a metric's timestamp_ns as the datetime ``timestamp``.
+    
+    Metrics used to store ``timestamp`` as a datetime field; the property
+    keeps that attribute readable for existing callers.
+    """
+    
+    __slots__ = ()
+    
+    @property
+    def timestamp(self) -> datetime:
+        """When the metric was recorded, as a local datetime."""
+        return _datetime_ns(self.timestamp_ns)
+
+
+@slotted
 @dataclass
-class APICallMetric:
+class APICallMetric(_Timestamped):
     """Metric for a single API call."""
     service: str  # 'github' or 'gemini'
     endpoint: str
     duration_ms: float
     success: bool
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp_ns: int = field(default_factory=time.time_ns)
     error: Optional[str] = None
     
     def to_dict(self) -> Dict[str, Any]:
@@ -29,18 +61,19 @@ class APICallMetric:
             'endpoint': self.endpoint,
             'duration_ms': self.duration_ms,
             'success': self.success,
-            'timestamp': self.timestamp.isoformat(),
+            'timestamp': _isoformat_ns(self.timestamp_ns),
             'error': self.error
         }
 
 
+@slotted
 @dataclass
-class AnalysisMetric:
+class AnalysisMetric(_Timestamped):
     """Metric for repository analysis."""
     repository: str
     duration_ms: float
     success: bool
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp_ns: int = field(default_factory=time.time_ns)
     error: Optional[str] = None
     
     def to_dict(self) -> Dict[str, Any]:
@@ -49,18 +82,19 @@ class AnalysisMetric:
             'repository': self.repository,
             'duration_ms': self.duration_ms,
             'success': self.success,
-            'timestamp': self.timestamp.isoformat(),
+            'timestamp': _isoformat_ns(self.timestamp_ns),
             'error': self.error
         }
 
 
+@slotted
 @dataclass
-class SuggestionMetric:
+class SuggestionMetric(_Timestamped):
     """Metric for suggestion generation."""
     repository: str
     category: str
     priority: str
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp_ns: int = field(default_factory=time.time_ns)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -68,18 +102,25 @@ class SuggestionMetric:
             'repository': self.repository,
             'category': self.category,
             'priority': self.priority,
-            'timestamp': self.timestamp.isoformat()
+            'timestamp': _isoformat_ns(self.timestamp_ns)
         }
 
 
+@slotted
 @dataclass
-class TokenUsageMetric:
+class TokenUsageMetric(_Timestamped):
     """Metric for LLM token usage."""
     model: str
     prompt_tokens: int
     completion_tokens: int
-    total_tokens: int
-    timestamp: datetime = field(default_factory=datetime.now)
+    # Derived from the two counts when omitted; still accepted for old callers
+    total_tokens: Optional[int] = None
+    timestamp_ns: int = field(default_factory=time.time_ns)
+    
+    def __post_init__(self):
+        """Fill in total_tokens from the prompt and completion counts."""
+        if self.total_tokens is None:
+            self.total_tokens = self.prompt_tokens + self.completion_tokens
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -88,7 +129,7 @@ class TokenUsageMetric:
             'prompt_tokens': self.prompt_tokens,
             'completion_tokens': self.completion_tokens,
             'total_tokens': self.total_tokens,
-            'timestamp': self.timestamp.isoformat()
+            'timestamp': _isoformat_ns(self.timestamp_ns)
         }
 
 
@@ -99,16 +140,35 @@ class MetricsCollector:
     and concurrent operations.
     """
     
+    # Event kinds accepted by record_batch, mapped to the record_* method they call
+    BATCH_EVENT_METHODS = {
+        'analysis': 'record_analysis_duration',
+        'suggestion': 'record_suggestion_generated',
+        'issue': 'record_issue_created',
+        'approval': 'record_user_approval',
+        'api_call': 'record_api_call',
+        'token_usage': 'record_token_usage',
+        'error': 'record_error',
+        'recovery': 'record_recovery',
+    }
+    
     def __init__(self):
         """Initialize the metrics collector."""
         self._lock = threading.RLock()  # Use RLock for reentrant locking
         
         # Performance metrics
-        self._analysis_metrics: List[AnalysisMetric] = []
-        self._api_call_metrics: List[APICallMetric] = []
+        self._analysis_metrics: Deque[AnalysisMetric] = deque(maxlen=MAX_METRIC_HISTORY)
+        self._api_call_metrics: Deque[APICallMetric] = deque(maxlen=MAX_METRIC_HISTORY)
+        self._analyses_recorded: int = 0
+        self._analysis_duration_sum: float = 0.0  # successful analyses only
+        self._api_calls_recorded: int = 0
+        self._api_latency_sums: Dict[str, float] = defaultdict(float)  # successful calls by service
+        self._api_success_counts: Dict[str, int] = defaultdict(int)
         
         # Usage metrics
-        self._suggestion_metrics: List[SuggestionMetric] = []
+        self._suggestion_metrics: Deque[SuggestionMetric] = deque(maxlen=MAX_METRIC_HISTORY)
+        self._suggestions_by_category: Dict[str, int] = defaultdict(int)
+        self._suggestions_by_priority: Dict[str, int] = defaultdict(int)
         self._repos_analyzed: int = 0
         self._suggestions_generated: int = 0
         self._issues_created: int = 0
@@ -118,14 +178,21 @@ class MetricsCollector:
         # Quality metrics
         self._error_counts: Dict[str, int] = defaultdict(int)
         self._recovery_counts: Dict[str, int] = defaultdict(int)
+        self._total_errors: int = 0
+        self._total_recoveries: int = 0
         
         # Cost metrics
-        self._token_usage_metrics: List[TokenUsageMetric] = []
-        self._github_api_calls: int = 0
-        self._gemini_api_calls: int = 0
+        self._token_usage_metrics: Deque[TokenUsageMetric] = deque(maxlen=MAX_METRIC_HISTORY)
+        self._total_tokens: int = 0
+        self._api_call_counts: Dict[str, int] = defaultdict(int)  # all calls by service
         
         # Session tracking
         self._session_start_time: Optional[float] = None
+        
+        # Summary cache, rebuilt when a record_* call or reset bumps the version
+        self._version: int = 0
+        self._summary_cache: Optional[Dict[str, Any]] = None
+        self._summary_version: int = -1
     
     def start_session(self) -> None:
         """Mark the start of a session."""
@@ -142,6 +209,7 @@ class MetricsCollector:
             error: Optional error message if failed
         """
         with self._lock:
+            self._version += 1
             metric = AnalysisMetric(
                 repository=repo,
                 duration_ms=duration_ms,
@@ -149,9 +217,11 @@ class MetricsCollector:
                 error=error
             )
             self._analysis_metrics.append(metric)
+            self._analyses_recorded += 1
             
             if success:
                 self._repos_analyzed += 1
+                self._analysis_duration_sum += duration_ms
     
     def record_suggestion_generated(self, repo: str, category: str, priority: str) -> None:
         """Record a generated suggestion.
@@ -162,6 +232,7 @@ class MetricsCollector:
             priority: Suggestion priority
         """
         with self._lock:
+            self._version += 1
             metric = SuggestionMetric(
                 repository=repo,
                 category=category,
@@ -169,10 +240,13 @@ class MetricsCollector:
             )
             self._suggestion_metrics.append(metric)
             self._suggestions_generated += 1
+            self._suggestions_by_category[category] += 1
+            self._suggestions_by_priority[priority] += 1
     
     def record_issue_created(self) -> None:
         """Record a created GitHub issue."""
         with self._lock:
+            self._version += 1
             self._issues_created += 1
     
     def record_user_approval(self, approved: bool) -> None:
@@ -182,6 +256,7 @@ class MetricsCollector:
             approved: True if approved, False if rejected
         """
         with self._lock:
+            self._version += 1
             if approved:
                 self._user_approvals += 1
             else:
@@ -205,6 +280,7 @@ class MetricsCollector:
             error: Optional error message if failed
         """
         with self._lock:
+            self._version += 1
             metric = APICallMetric(
                 service=service,
                 endpoint=endpoint,
@@ -213,12 +289,13 @@ class MetricsCollector:
                 error=error
             )
             self._api_call_metrics.append(metric)
+            self._api_calls_recorded += 1
             
-            # Track API call counts
-            if service == 'github':
-                self._github_api_calls += 1
-            elif service == 'gemini':
-                self._gemini_api_calls += 1
+            self._api_call_counts[service] += 1
+            
+            if success:
+                self._api_latency_sums[service] += duration_ms
+                self._api_success_counts[service] += 1
     
     def record_token_usage(
         self,
@@ -234,13 +311,14 @@ class MetricsCollector:
             completion_tokens: Number of completion tokens
         """
         with self._lock:
+            self._version += 1
             metric = TokenUsageMetric(
                 model=model,
                 prompt_tokens=prompt_tokens,
-                completion_tokens=completion_tokens,
-                total_tokens=prompt_tokens + completion_tokens
+                completion_tokens=completion_tokens
             )
             self._token_usage_metrics.append(metric)
+            self._total_tokens += metric.total_tokens
     
     def record_error(self, error_type: str) -> None:
         """Record an error occurrence.
@@ -249,7 +327,9 @@ class MetricsCollector:
             error_type: Type/category of error
         """
         with self._lock:
+            self._version += 1
             self._error_counts[error_type] += 1
+            self._total_errors += 1
     
     def record_recovery(self, recovery_type: str) -> None:
         """Record a successful error recovery.
@@ -258,7 +338,29 @@ class MetricsCollector:
             recovery_type: Type of recovery performed
         """
         with self._lock:
+            self._version += 1
             self._recovery_counts[recovery_type] += 1
+            self._total_recoveries += 1
+    
+    def record_batch(self, events: Iterable[Tuple[str, tuple]]) -> None:
+        """Record several metrics while acquiring the lock only once.
+        
+        Args:
+            events: (kind, args) pairs, where kind is a key of
+                BATCH_EVENT_METHODS and args are the positional arguments
+                of the matching record_* method
+            
+        Raises:
+            ValueError: If an event kind is unknown; nothing is recorded
+        """
+        events = list(events)
+        for kind, _ in events:
+            if kind not in self.BATCH_EVENT_METHODS:
+                raise ValueError(f"Unknown metric event kind: {kind}")
+        
+        with self._lock:
+            for kind, args in events:
+                getattr(self, self.BATCH_EVENT_METHODS[kind])(*args)
     
     def get_session_duration_seconds(self) -> float:
         """Get the current session duration in seconds.
@@ -278,15 +380,10 @@ class MetricsCollector:
             Average duration in milliseconds, or 0 if no analyses
         """
         with self._lock:
-            if not self._analysis_metrics:
-                return 0.0
-            
-            successful_analyses = [m for m in self._analysis_metrics if m.success]
-            if not successful_analyses:
+            if self._repos_analyzed == 0:
                 return 0.0
             
-            total_duration = sum(m.duration_ms for m in successful_analyses)
-            return total_duration / len(successful_analyses)
+            return self._analysis_duration_sum / self._repos_analyzed
     
     def get_average_api_latency(self, service: Optional[str] = None) -> float:
         """Get average API call latency in milliseconds.
@@ -298,20 +395,17 @@ class MetricsCollector:
             Average latency in milliseconds, or 0 if no calls
         """
         with self._lock:
-            metrics = self._api_call_metrics
-            
             if service:
-                metrics = [m for m in metrics if m.service == service]
-            
-            if not metrics:
-                return 0.0
+                total_duration = self._api_latency_sums.get(service, 0.0)
+                successful_calls = self._api_success_counts.get(service, 0)
+            else:
+                total_duration = sum(self._api_latency_sums.values())
+                successful_calls = sum(self._api_success_counts.values())
             
-            successful_calls = [m for m in metrics if m.success]
-            if not successful_calls:
+            if successful_calls == 0:
                 return 0.0
             
-            total_duration = sum(m.duration_ms for m in successful_calls)
-            return total_duration / len(successful_calls)
+            return total_duration / successful_calls
     
     def get_error_rate(self) -> float:
         """Get overall error rate as a percentage.
@@ -320,16 +414,12 @@ class MetricsCollector:
             Error rate (0.0 to 100.0)
         """
         with self._lock:
-            total_operations = (
-                len(self._analysis_metrics) +
-                len(self._api_call_metrics)
-            )
+            total_operations = self._analyses_recorded + self._api_calls_recorded
             
             if total_operations == 0:
                 return 0.0
             
-            total_errors = sum(self._error_counts.values())
-            return (total_errors / total_operations) * 100.0
+            return (self._total_errors / total_operations) * 100.0
     
     def get_recovery_success_rate(self) -> float:
         """Get error recovery success rate as a percentage.
@@ -338,13 +428,10 @@ class MetricsCollector:
             Recovery success rate (0.0 to 100.0)
         """
         with self._lock:
-            total_errors = sum(self._error_counts.values())
-            
-            if total_errors == 0:
+            if self._total_errors == 0:
                 return 100.0  # No errors means 100% success
             
-            total_recoveries = sum(self._recovery_counts.values())
-            return (total_recoveries / total_errors) * 100.0
+            return (self._total_recoveries / self._total_errors) * 100.0
     
     def get_user_approval_rate(self) -> float:
         """Get user approval rate as a percentage.
@@ -367,7 +454,7 @@ class MetricsCollector:
             Total token count
         """
         with self._lock:
-            return sum(m.total_tokens for m in self._token_usage_metrics)
+            return self._total_tokens
     
     def get_estimated_cost(self, cost_per_1k_tokens: float = 0.001) -> float:
         """Get estimated cost based on token usage.
@@ -388,10 +475,7 @@ class MetricsCollector:
             Dictionary mapping category to count
         """
         with self._lock:
-            counts: Dict[str, int] = defaultdict(int)
-            for metric in self._suggestion_metrics:
-                counts[metric.category] += 1
-            return dict(counts)
+            return dict(self._suggestions_by_category)
     
     def get_suggestions_by_priority(self) -> Dict[str, int]:
         """Get suggestion counts by priority.
@@ -400,17 +484,34 @@ class MetricsCollector:
             Dictionary mapping priority to count
         """
         with self._lock:
-            counts: Dict[str, int] = defaultdict(int)
-            for metric in self._suggestion_metrics:
-                counts[metric.priority] += 1
-            return dict(counts)
+            return dict(self._suggestions_by_priority)
     
     def get_session_summary(self) -> Dict[str, Any]:
         """Get aggregated metrics for current session.
         
+        The summary is cached until the next recorded metric; only the session
+        duration is recomputed on every call.
+        
         Returns:
             Dictionary containing session metrics summary
         """
+        with self._lock:
+            if self._summary_version != self._version:
+                self._summary_cache = self._build_session_summary()
+                self._summary_version = self._version
+            
+            summary = {
+                section: {
+                    name: dict(value) if isinstance(value, dict) else value
+                    for name, value in values.items()
+                }
+                for section, values in self._summary_cache.items()
+            }
+            summary['performance']['session_duration_seconds'] = self.get_session_duration_seconds()
+            return summary
+    
+    def _build_session_summary(self) -> Dict[str, Any]:
+        """Compute the session summary from the current metrics."""
         with self._lock:
             return {
                 # Performance metrics
@@ -442,8 +543,8 @@ class MetricsCollector:
                 # Cost metrics
                 'cost': {
                     'total_tokens_used': self.get_total_tokens_used(),
-                    'github_api_calls': self._github_api_calls,
-                    'gemini_api_calls': self._gemini_api_calls,
+                    'github_api_calls': self._api_call_counts.get('github', 0),
+                    'gemini_api_calls': self._api_call_counts.get('gemini', 0),
                     'estimated_cost_usd': self.get_estimated_cost(),
                 },
                 
@@ -457,22 +558,33 @@ class MetricsCollector:
     def reset(self) -> None:
         """Reset all metrics (useful for testing or new sessions)."""
         with self._lock:
+            self._version += 1
             self._analysis_metrics.clear()
             self._api_call_metrics.clear()
             self._suggestion_metrics.clear()
             self._token_usage_metrics.clear()
             
+            self._analyses_recorded = 0
+            self._analysis_duration_sum = 0.0
+            self._api_calls_recorded = 0
+            self._api_latency_sums.clear()
+            self._api_success_counts.clear()
+            self._total_tokens = 0
+            
             self._repos_analyzed = 0
             self._suggestions_generated = 0
+            self._suggestions_by_category.clear()
+            self._suggestions_by_priority.clear()
             self._issues_created = 0
             self._user_approvals = 0
             self._user_rejections = 0
             
             self._error_counts.clear()
             self._recovery_counts.clear()
+            self._total_errors = 0
+            self._total_recoveries = 0
             
-            self._github_api_calls = 0
-            self._gemini_api_calls = 0
+            self._api_call_counts.clear()
             
             self._session_start_time = None
 
@@ -0,0 +1,25 @@
+"""Helpers for memory-lean dataclasses."""
+
+from dataclasses import fields
+
+
+def slotted(cls):
+    """Rebuild a dataclass with __slots__ for its fields.
+    
+    Equivalent to dataclass(slots=True), which needs Python 3.10. Fields with
+    defaults can't be listed in a hand-written __slots__, since the class
+    attribute holding the default would clash with the slot.
+    
+    Apply it above @dataclass:
+    
+        @slotted
+        @dataclass
+        class Metric:
+            ...
+    """
+    names = tuple(f.name for f in fields(cls))
+    namespace = {k: v for k, v in cls.__dict__.items() if k not in names}
+    namespace.pop('__dict__', None)
+    namespace.pop('__weakref__', None)
+    namespace['__slots__'] = names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
@@ -5,6 +5,7 @@ import logging
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 import requests
+from requests.adapters import HTTPAdapter
 
 from ..config import get_config
 
@@ -37,17 +38,27 @@ class RepositoryNotFoundError(GitHubAPIError):
 class GitHubClient:
     """GitHub API client with authentication and error handling."""
     
-    def __init__(self, token: Optional[str] = None, base_url: Optional[str] = None):
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        base_url: Optional[str] = None,
+        pool_size: Optional[int] = None
+    ):
         """Initialize GitHub client.
         
         Args:
             token: GitHub personal access token (defaults to config)
             base_url: GitHub API base URL (defaults to config)
+            pool_size: Connections kept open to the API, one per worker thread
+                sharing this client (defaults to config.max_parallel_repos)
         """
         config = get_config()
         self.token = token or config.github_token
         self.base_url = (base_url or config.github_api_base_url).rstrip('/')
         self.session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=pool_size or config.max_parallel_repos)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.session.headers.update({
             'Authorization': f'token {self.token}',
             'Accept': 'application/vnd.github.v3+json',
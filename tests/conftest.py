@@ -0,0 +1,27 @@
+"""Shared pytest configuration for the test suite."""
+
+from datetime import datetime
+
+import pytest
+
+from src.models import Repository
+
+
+def make_repository() -> Repository:
+    """Build the valid test repository used across the suite."""
+    return Repository(
+        name="test-repo",
+        full_name="user/test-repo",
+        owner="user",
+        url="https://github.com/user/test-repo",
+        default_branch="main",
+        visibility="public",
+        created_at=datetime(2024, 1, 1),
+        updated_at=datetime(2024, 11, 29)
+    )
+
+
+@pytest.fixture
+def repository() -> Repository:
+    """Provide a fresh test repository, so mutations never leak between tests."""
+    return make_repository()
@@ -8,10 +8,15 @@ This module tests:
 """
 
 import os
+import re
+import shutil
 import subprocess
+import tempfile
 import time
 import pytest
+from contextlib import contextmanager
 from pathlib import Path
+from typing import NamedTuple
 
 
 # Test configuration
@@ -19,158 +24,361 @@ PROJECT_ROOT = Path(__file__).parent.parent
 DOCKERFILE_PATH = PROJECT_ROOT / "Dockerfile"
 DOCKER_COMPOSE_PATH = PROJECT_ROOT / "docker-compose.yml"
 ENV_EXAMPLE_PATH = PROJECT_ROOT / ".env.example"
+IMAGE_TAG = "github-maintainer-agent:test"
+# Per-process name so concurrent sessions never share or remove each other's builder
+BUILDER_NAME = f"pytest-builder-{os.getpid()}"
+# Persistent buildx layer cache; mount it as a CI cache to reuse it across runs
+BUILD_CACHE_DIR = os.getenv(
+    "DOCKER_BUILD_CACHE_DIR", os.path.join(tempfile.gettempdir(), "bx-cache")
+)
+# RAM-backed directory used to stage the build context when it has room
+TMPFS_ROOT = "/dev/shm"
+# GitHub token and Google API key prefixes
+_CRED_RE = re.compile(r'(ghp_|AIza)')
+
+
+def _docker_available():
+    """Return True if the docker CLI is installed and runs."""
+    if shutil.which('docker') is None:
+        return False
+    return subprocess.run(['docker', '--version'], capture_output=True).returncode == 0
+
+
+# Checked once at import instead of once per skipif decorator
+DOCKER_AVAILABLE = _docker_available()
+
+
+def _buildx_available():
+    """Return True if the docker CLI has the buildx plugin."""
+    return subprocess.run(['docker', 'buildx', 'version'], capture_output=True).returncode == 0
+
+
+class BuildResult(NamedTuple):
+    """Outcome of the session's image build."""
+    
+    tag: str
+    returncode: int
+    stdout: str
+    stderr: str
+
+
+def _context_files():
+    """List the checkout's files as git sees them (tracked plus untracked, not ignored).
+    
+    Returns None outside a git checkout. Docker still applies .dockerignore
+    to whatever is staged, so no ignore rules are evaluated here.
+    """
+    result = subprocess.run(
+        ['git', 'ls-files', '-z', '--cached', '--others', '--exclude-standard'],
+        cwd=PROJECT_ROOT,
+        capture_output=True
+    )
+    if result.returncode != 0:
+        return None
+    return [name for name in result.stdout.decode().split('\0') if name]
+
+
+@contextmanager
+def _buildx_builder():
+    """Yield a throwaway docker-container buildx builder, removed on exit.
+    
+    The default docker driver cannot export a local layer cache, so the
+    build runs on its own builder; layers outlive it in BUILD_CACHE_DIR.
+    """
+    subprocess.run(
+        [
+            'docker', 'buildx', 'create',
+            '--name', BUILDER_NAME,
+            '--driver-opt', 'network=host'
+        ],
+        capture_output=True,
+        check=True
+    )
+    try:
+        yield BUILDER_NAME
+    finally:
+        # Also stops and removes the builder's BuildKit container
+        subprocess.run(['docker', 'buildx', 'rm', BUILDER_NAME], capture_output=True)
+
+
+def _staging_root(files):
+    """Pick where to stage the build context: tmpfs if the files fit, else the temp dir.
+    
+    /dev/shm is only 64MB by default in Docker and most CI containers, so
+    it is used only when it has room for the context with space to spare.
+    """
+    if os.getenv("DOCKER_BUILD_TMPFS") == "0" or not os.path.isdir(TMPFS_ROOT):
+        return None
+    size = sum(
+        os.lstat(PROJECT_ROOT / name).st_size
+        for name in files
+        if os.path.lexists(PROJECT_ROOT / name)
+    )
+    if shutil.disk_usage(TMPFS_ROOT).free < 2 * size:
+        return None
+    return TMPFS_ROOT
+
+
+@contextmanager
+def _build_context():
+    """Yield a staged copy of the checkout's files to build from.
+    
+    The copy goes to /dev/shm when it fits there (and DOCKER_BUILD_TMPFS is
+    not "0") so sending the context never touches the runner's disk, and to
+    a tempfile.mkdtemp() directory otherwise. Outside a git checkout the
+    project root is used in place.
+    """
+    files = _context_files()
+    if files is None:
+        yield PROJECT_ROOT
+        return
+    
+    with tempfile.TemporaryDirectory(prefix="agent-build-", dir=_staging_root(files)) as tmp:
+        for name in files:
+            source = PROJECT_ROOT / name
+            # Tracked files deleted from the working tree are still listed
+            if not os.path.lexists(source):
+                continue
+            target = os.path.join(tmp, name)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            shutil.copy2(source, target, follow_symlinks=False)
+        yield tmp
+
+
+def _build_image(tag, builder, cache_dir=BUILD_CACHE_DIR, quiet=True):
+    """Build the project image with buildx, reusing layers from a local cache.
+    
+    Args:
+        tag: Tag to apply to the built image
+        builder: Name of the buildx builder to build with
+        cache_dir: Directory to import layer cache from and export it to
+        quiet: Whether to pass -q to docker buildx build
+        
+    Returns:
+        subprocess.CompletedProcess for the build invocation
+    """
+    args = ['docker', 'buildx', 'build', '--builder', builder]
+    if os.path.isdir(cache_dir):
+        args.append(f'--cache-from=type=local,src={cache_dir}')
+    args += [
+        f'--cache-to=type=local,dest={cache_dir},mode=max',
+        '--load',
+        '-t', tag,
+    ]
+    if quiet:
+        args.append('-q')
+    args.append('.')
+    
+    with _build_context() as context_dir:
+        return subprocess.run(
+            args,
+            cwd=context_dir,
+            capture_output=True,
+            text=True,
+            timeout=300  # 5 minute timeout
+        )
+
+
+@pytest.fixture(scope="session")
+def docker_client():
+    """Docker SDK client shared by the session, talking to the daemon socket."""
+    docker = pytest.importorskip("docker")
+    try:
+        client = docker.from_env()
+        client.ping()
+    except docker.errors.DockerException as e:
+        pytest.skip(f"Docker daemon not reachable: {e}")
+    
+    yield client
+    
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def docker_build(docker_client):
+    """Build the test image once per session and remove it afterwards.
+    
+    Unchanged layers come from BuildKit's local cache, so rebuilding an
+    unchanged context is cheap.
+    
+    Yields:
+        BuildResult for the session's build
+    """
+    if not _buildx_available():
+        pytest.skip("docker buildx not available")
+    with _buildx_builder() as builder:
+        result = _build_image(IMAGE_TAG, builder)
+    
+    yield BuildResult(IMAGE_TAG, result.returncode, result.stdout, result.stderr)
+    
+    # Cleanup test image after the session
+    try:
+        docker_client.images.remove(IMAGE_TAG, force=True)
+    except Exception:
+        pass  # Ignore cleanup errors
+
+
+@pytest.fixture(scope="session")
+def docker_image(docker_build):
+    """Tag of the session's test image; fails dependent tests if the build failed."""
+    if docker_build.returncode != 0:
+        pytest.fail(f"Docker build failed: {docker_build.stderr}")
+    return docker_build.tag
+
+
+def _dir_entries(path):
+    """Names in a directory from a single scandir call (empty if missing)."""
+    try:
+        with os.scandir(path) as it:
+            return frozenset(entry.name for entry in it)
+    except FileNotFoundError:
+        return frozenset()
+
+
+@pytest.fixture(scope="session")
+def repo_files():
+    """Names of the entries at the project root."""
+    return _dir_entries(PROJECT_ROOT)
+
+
+@pytest.fixture(scope="session")
+def docs_files():
+    """Names of the entries in docs/."""
+    return _dir_entries(PROJECT_ROOT / "docs")
+
+
+@pytest.fixture(scope="session")
+def k8s_files():
+    """Names of the entries in k8s/."""
+    return _dir_entries(PROJECT_ROOT / "k8s")
+
+
+@pytest.fixture(scope="module")
+def compose_config():
+    """Parse docker-compose.yml once per module."""
+    import yaml
+    try:
+        Loader = yaml.CSafeLoader
+    except AttributeError:
+        Loader = yaml.SafeLoader
+    return yaml.load(DOCKER_COMPOSE_PATH.read_text(encoding='utf-8'), Loader=Loader)
+
+
+@pytest.fixture(scope="module")
+def compose_services_lc(compose_config):
+    """Compose services keyed by casefolded service name."""
+    return {name.casefold(): service for name, service in compose_config['services'].items()}
+
+
+@pytest.fixture(scope="module")
+def compose_first_env(compose_config):
+    """Environment entries of the first compose service joined into one string."""
+    first_service = next(iter(compose_config['services'].values()))
+    return '\n'.join(map(str, first_service.get('environment', [])))
+
+
+@pytest.fixture(scope="module")
+def dockerfile_text():
+    """Read the Dockerfile once per module."""
+    return DOCKERFILE_PATH.read_text(encoding='utf-8')
+
+
+@pytest.fixture(scope="module")
+def dockerfile_instructions(dockerfile_text):
+    """Set of instruction keywords that start a non-comment Dockerfile line."""
+    return frozenset(
+        line.split(None, 1)[0].upper()
+        for line in dockerfile_text.splitlines()
+        if line.strip() and not line.lstrip().startswith('#')
+    )
+
+
+@pytest.fixture(scope="module")
+def env_example_text():
+    """Read .env.example once per module."""
+    return ENV_EXAMPLE_PATH.read_text(encoding='utf-8')
 
 
 class TestDockerBuild:
     """Tests for Docker build process."""
     
-    def test_dockerfile_exists(self):
+    def test_dockerfile_exists(self, repo_files):
         """Test that Dockerfile exists."""
-        assert DOCKERFILE_PATH.exists(), "Dockerfile not found"
+        assert DOCKERFILE_PATH.name in repo_files, "Dockerfile not found"
     
-    def test_dockerfile_has_required_instructions(self):
+    def test_dockerfile_has_required_instructions(self, dockerfile_text, dockerfile_instructions):
         """Test that Dockerfile contains required instructions."""
-        with open(DOCKERFILE_PATH, 'r') as f:
-            content = f.read()
-        
         # Check for essential Dockerfile instructions
-        assert 'FROM python:' in content, "Missing FROM instruction"
-        assert 'WORKDIR' in content, "Missing WORKDIR instruction"
-        assert 'COPY' in content, "Missing COPY instruction"
-        assert 'RUN' in content or 'pip install' in content, "Missing dependency installation"
-        assert 'ENTRYPOINT' in content or 'CMD' in content, "Missing ENTRYPOINT or CMD"
+        assert 'FROM' in dockerfile_instructions, "Missing FROM instruction"
+        assert 'FROM python:' in dockerfile_text, "Base image is not a python image"
+        assert 'WORKDIR' in dockerfile_instructions, "Missing WORKDIR instruction"
+        assert 'COPY' in dockerfile_instructions, "Missing COPY instruction"
+        assert 'RUN' in dockerfile_instructions, "Missing dependency installation"
+        assert not dockerfile_instructions.isdisjoint({'ENTRYPOINT', 'CMD'}), \
+            "Missing ENTRYPOINT or CMD"
     
-    def test_dockerfile_uses_non_root_user(self):
+    def test_dockerfile_uses_non_root_user(self, dockerfile_text, dockerfile_instructions):
         """Test that Dockerfile creates and uses non-root user."""
-        with open(DOCKERFILE_PATH, 'r') as f:
-            content = f.read()
-        
         # Check for user creation and switching
-        assert 'useradd' in content or 'adduser' in content, "Non-root user not created"
-        assert 'USER' in content, "Not switching to non-root user"
+        assert 'useradd' in dockerfile_text or 'adduser' in dockerfile_text, \
+            "Non-root user not created"
+        assert 'USER' in dockerfile_instructions, "Not switching to non-root user"
     
-    def test_dockerfile_has_healthcheck(self):
+    def test_dockerfile_has_healthcheck(self, dockerfile_instructions):
         """Test that Dockerfile includes health check."""
-        with open(DOCKERFILE_PATH, 'r') as f:
-            content = f.read()
-        
-        assert 'HEALTHCHECK' in content, "Missing HEALTHCHECK instruction"
+        assert 'HEALTHCHECK' in dockerfile_instructions, "Missing HEALTHCHECK instruction"
     
-    @pytest.mark.skipif(
-        subprocess.run(['docker', '--version'], capture_output=True).returncode != 0,
-        reason="Docker not available"
-    )
-    def test_docker_build_succeeds(self):
+    @pytest.mark.docker
+    @pytest.mark.slow
+    @pytest.mark.xdist_group("docker")
+    @pytest.mark.skipif(not DOCKER_AVAILABLE, reason="Docker not available")
+    def test_docker_build_succeeds(self, docker_client, docker_build):
         """Test that Docker image builds successfully."""
-        # Build the image
-        result = subprocess.run(
-            ['docker', 'build', '-t', 'github-maintainer-agent:test', '.'],
-            cwd=PROJECT_ROOT,
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minute timeout
-        )
-        
-        # Check build succeeded
-        assert result.returncode == 0, f"Docker build failed: {result.stderr}"
-        assert 'Successfully built' in result.stdout or 'Successfully tagged' in result.stdout
+        # The session fixture already built the image
+        assert docker_build.returncode == 0, f"Docker build failed: {docker_build.stderr}"
+        assert docker_client.images.list(name=docker_build.tag), "Built image not found"
     
-    @pytest.mark.skipif(
-        subprocess.run(['docker', '--version'], capture_output=True).returncode != 0,
-        reason="Docker not available"
-    )
-    def test_docker_image_size_reasonable(self):
+    @pytest.mark.docker
+    @pytest.mark.slow
+    @pytest.mark.xdist_group("docker")
+    @pytest.mark.skipif(not DOCKER_AVAILABLE, reason="Docker not available")
+    def test_docker_image_size_reasonable(self, docker_client, docker_image):
         """Test that Docker image size is reasonable (< 2GB)."""
-        # First ensure image is built
-        subprocess.run(
-            ['docker', 'build', '-t', 'github-maintainer-agent:test', '-q', '.'],
-            cwd=PROJECT_ROOT,
-            capture_output=True,
-            timeout=300
-        )
-        
-        # Get image size
-        result = subprocess.run(
-            ['docker', 'images', 'github-maintainer-agent:test', '--format', '{{.Size}}'],
-            capture_output=True,
-            text=True
-        )
-        
-        if result.returncode == 0 and result.stdout.strip():
-            size_str = result.stdout.strip()
-            # Parse size (e.g., "1.5GB" or "500MB")
-            if 'GB' in size_str:
-                size_gb = float(size_str.replace('GB', ''))
-                assert size_gb < 2.0, f"Image size too large: {size_str}"
+        # Image size in bytes, no unit parsing needed
+        size_bytes = docker_client.images.get(docker_image).attrs['Size']
+        assert size_bytes < 2 * 1024 ** 3, f"Image size too large: {size_bytes} bytes"
 
 
 class TestDockerCompose:
     """Tests for docker-compose configuration."""
     
-    def test_docker_compose_exists(self):
+    def test_docker_compose_exists(self, repo_files):
         """Test that docker-compose.yml exists."""
-        assert DOCKER_COMPOSE_PATH.exists(), "docker-compose.yml not found"
+        assert DOCKER_COMPOSE_PATH.name in repo_files, "docker-compose.yml not found"
     
-    def test_docker_compose_valid_yaml(self):
+    def test_docker_compose_valid_yaml(self, compose_config):
         """Test that docker-compose.yml is valid YAML."""
-        import yaml
-        
-        with open(DOCKER_COMPOSE_PATH, 'r') as f:
-            config = yaml.safe_load(f)
-        
-        assert config is not None, "docker-compose.yml is empty"
-        assert 'services' in config, "Missing services section"
+        assert compose_config is not None, "docker-compose.yml is empty"
+        assert 'services' in compose_config, "Missing services section"
     
-    def test_docker_compose_has_required_service(self):
+    def test_docker_compose_has_required_service(self, compose_services_lc):
         """Test that docker-compose.yml defines the agent service."""
-        import yaml
-        
-        with open(DOCKER_COMPOSE_PATH, 'r') as f:
-            config = yaml.safe_load(f)
-        
-        services = config.get('services', {})
-        assert len(services) > 0, "No services defined"
+        assert len(compose_services_lc) > 0, "No services defined"
         
         # Check for agent service (name may vary)
-        service_names = list(services.keys())
-        assert any('agent' in name.lower() for name in service_names), \
+        assert any('agent' in name for name in compose_services_lc), \
             "No agent service found"
     
-    def test_docker_compose_has_environment_variables(self):
+    def test_docker_compose_has_environment_variables(self, compose_first_env):
         """Test that docker-compose.yml includes required environment variables."""
-        import yaml
-        
-        with open(DOCKER_COMPOSE_PATH, 'r') as f:
-            config = yaml.safe_load(f)
-        
-        services = config.get('services', {})
-        first_service = list(services.values())[0]
-        
-        env_vars = first_service.get('environment', [])
-        env_dict = {}
-        
-        # Parse environment variables
-        for env in env_vars:
-            if isinstance(env, str) and '=' in env:
-                key, _ = env.split('=', 1)
-                env_dict[key] = True
-            elif isinstance(env, dict):
-                env_dict.update(env)
-        
-        # Check for required environment variables
-        assert 'GITHUB_TOKEN' in env_dict or any('GITHUB_TOKEN' in str(e) for e in env_vars), \
+        assert 'GITHUB_TOKEN' in compose_first_env, \
             "Missing GITHUB_TOKEN environment variable"
-        assert any('GEMINI' in str(e) or 'GOOGLE_API_KEY' in str(e) for e in env_vars), \
+        assert 'GEMINI' in compose_first_env or 'GOOGLE_API_KEY' in compose_first_env, \
             "Missing Gemini API key environment variable"
     
-    def test_docker_compose_has_volumes(self):
+    def test_docker_compose_has_volumes(self, compose_config):
         """Test that docker-compose.yml includes volume mounts."""
-        import yaml
-        
-        with open(DOCKER_COMPOSE_PATH, 'r') as f:
-            config = yaml.safe_load(f)
-        
-        services = config.get('services', {})
+        services = compose_config.get('services', {})
         first_service = list(services.values())[0]
         
         volumes = first_service.get('volumes', [])
@@ -180,15 +388,12 @@ class TestDockerCompose:
 class TestEnvironmentConfiguration:
     """Tests for environment variable configuration."""
     
-    def test_env_example_exists(self):
+    def test_env_example_exists(self, repo_files):
         """Test that .env.example file exists."""
-        assert ENV_EXAMPLE_PATH.exists(), ".env.example not found"
+        assert ENV_EXAMPLE_PATH.name in repo_files, ".env.example not found"
     
-    def test_env_example_has_required_variables(self):
+    def test_env_example_has_required_variables(self, env_example_text):
         """Test that .env.example includes all required variables."""
-        with open(ENV_EXAMPLE_PATH, 'r') as f:
-            content = f.read()
-        
         required_vars = [
             'GITHUB_TOKEN',
             'GEMINI_API_KEY',
@@ -196,166 +401,120 @@ class TestEnvironmentConfiguration:
         ]
         
         for var in required_vars:
-            assert var in content, f"Missing {var} in .env.example"
+            assert var in env_example_text, f"Missing {var} in .env.example"
     
-    def test_env_example_has_comments(self):
+    def test_env_example_has_comments(self, env_example_text):
         """Test that .env.example includes helpful comments."""
-        with open(ENV_EXAMPLE_PATH, 'r') as f:
-            content = f.read()
-        
         # Check for comment lines
-        lines = content.split('\n')
+        lines = env_example_text.split('\n')
         comment_lines = [line for line in lines if line.strip().startswith('#')]
         
         assert len(comment_lines) > 0, ".env.example should include comments"
     
-    def test_env_example_no_real_credentials(self):
+    def test_env_example_no_real_credentials(self, env_example_text):
         """Test that .env.example doesn't contain real credentials."""
-        with open(ENV_EXAMPLE_PATH, 'r') as f:
-            content = f.read()
-        
         # Check for placeholder values
-        suspicious_patterns = [
-            'ghp_',  # GitHub token prefix
-            'AIza',  # Google API key prefix
-        ]
-        
-        for pattern in suspicious_patterns:
-            assert pattern not in content or 'your_' in content.lower(), \
-                f"Possible real credential found: {pattern}"
+        match = _CRED_RE.search(env_example_text)
+        assert match is None or 'your_' in env_example_text.casefold(), \
+            f"Possible real credential found: {match and match.group(0)}"
 
 
 class TestContainerStartup:
     """Tests for container startup and health checks."""
     
-    @pytest.mark.skipif(
-        subprocess.run(['docker', '--version'], capture_output=True).returncode != 0,
-        reason="Docker not available"
-    )
-    def test_container_starts_with_help_command(self):
+    pytestmark = [pytest.mark.docker, pytest.mark.slow]
+    
+    @pytest.mark.xdist_group("docker")
+    @pytest.mark.skipif(not DOCKER_AVAILABLE, reason="Docker not available")
+    def test_container_starts_with_help_command(self, docker_client, docker_image):
         """Test that container starts and shows help."""
-        # Build image first
-        subprocess.run(
-            ['docker', 'build', '-t', 'github-maintainer-agent:test', '-q', '.'],
-            cwd=PROJECT_ROOT,
-            capture_output=True,
-            timeout=300
-        )
-        
-        # Run container with --help
-        result = subprocess.run(
-            ['docker', 'run', '--rm', 'github-maintainer-agent:test', '--help'],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
+        # Run the image's own ENTRYPOINT and default CMD (--help);
+        # a non-zero exit raises ContainerError
+        output = docker_client.containers.run(docker_image, remove=True).decode()
         
-        assert result.returncode == 0, f"Container failed to start: {result.stderr}"
-        assert 'usage:' in result.stdout.lower() or 'help' in result.stdout.lower(), \
+        assert 'usage:' in output.lower() or 'help' in output.lower(), \
             "Help output not found"
     
-    @pytest.mark.skipif(
-        subprocess.run(['docker', '--version'], capture_output=True).returncode != 0,
-        reason="Docker not available"
-    )
-    def test_container_healthcheck_works(self):
-        """Test that container health check works."""
-        # Build image first
-        subprocess.run(
-            ['docker', 'build', '-t', 'github-maintainer-agent:test', '-q', '.'],
-            cwd=PROJECT_ROOT,
-            capture_output=True,
-            timeout=300
-        )
-        
-        # Start container in background
-        container_name = f"test-agent-{int(time.time())}"
-        start_result = subprocess.run(
-            [
-                'docker', 'run', '-d',
-                '--name', container_name,
-                'github-maintainer-agent:test',
-                'python', '-c', 'import time; time.sleep(60)'
+    @pytest.mark.xdist_group("docker")
+    @pytest.mark.skipif(not DOCKER_AVAILABLE, reason="Docker not available")
+    def test_container_accepts_environment_variables(self, docker_client, docker_image):
+        """Test that the container's Python process receives environment variables."""
+        # Print the variables as the interpreter inside the container sees them
+        output = docker_client.containers.run(
+            docker_image,
+            entrypoint=['python', '-c'],
+            command=[
+                'import os; print(f"LOG_LEVEL={os.getenv(\'LOG_LEVEL\')}, '
+                'MAX_PARALLEL_REPOS={os.getenv(\'MAX_PARALLEL_REPOS\')}")'
             ],
-            capture_output=True,
-            text=True
-        )
+            environment={'LOG_LEVEL': 'DEBUG', 'MAX_PARALLEL_REPOS': '10'},
+            remove=True
+        ).decode()
         
-        if start_result.returncode != 0:
-            pytest.skip(f"Could not start container: {start_result.stderr}")
+        assert 'LOG_LEVEL=DEBUG' in output, "LOG_LEVEL not set correctly"
+        assert 'MAX_PARALLEL_REPOS=10' in output, "MAX_PARALLEL_REPOS not set correctly"
+    
+    @pytest.mark.xdist_group("docker")
+    @pytest.mark.skipif(not DOCKER_AVAILABLE, reason="Docker not available")
+    def test_container_healthcheck_works(self, docker_client, docker_image):
+        """Test that container health check works."""
+        import docker
         
+        # Start container in background
+        # Include the xdist worker id so parallel workers never collide
+        worker = os.environ.get("PYTEST_XDIST_WORKER", "")
+        container_name = f"test-agent-{worker}-{int(time.time())}"
         try:
-            # Wait a bit for health check
-            time.sleep(5)
-            
-            # Check health status
-            health_result = subprocess.run(
-                ['docker', 'inspect', '--format', '{{.State.Health.Status}}', container_name],
-                capture_output=True,
-                text=True
+            container = docker_client.containers.run(
+                docker_image,
+                entrypoint=['python', '-c'],
+                command=['import time; time.sleep(60)'],
+                name=container_name,
+                # Keep the image's HEALTHCHECK command but probe every second
+                # instead of every 30s so the test does not wait on the interval
+                healthcheck={'interval': 1_000_000_000},
+                detach=True
             )
+        except docker.errors.APIError as e:
+            pytest.skip(f"Could not start container: {e}")
+        
+        try:
+            # Poll until the health check passes or fails
+            deadline = time.monotonic() + 30
+            delay = 0.1
+            while True:
+                container.reload()
+                health_status = container.attrs['State'].get('Health', {}).get('Status', 'none')
+                if health_status in ('healthy', 'unhealthy', 'none'):
+                    break
+                assert time.monotonic() < deadline, \
+                    f"Health check still {health_status!r} after 30s"
+                time.sleep(delay)
+                delay = min(delay * 2, 1.0)
             
-            # Health status should be "healthy" or "starting"
-            health_status = health_result.stdout.strip()
-            assert health_status in ['healthy', 'starting', 'none'], \
-                f"Unexpected health status: {health_status}"
+            assert health_status == 'healthy', f"Unexpected health status: {health_status}"
         
         finally:
             # Cleanup
-            subprocess.run(['docker', 'stop', container_name], capture_output=True)
-            subprocess.run(['docker', 'rm', container_name], capture_output=True)
-    
-    @pytest.mark.skipif(
-        subprocess.run(['docker', '--version'], capture_output=True).returncode != 0,
-        reason="Docker not available"
-    )
-    def test_container_accepts_environment_variables(self):
-        """Test that container properly receives environment variables."""
-        # Build image first
-        subprocess.run(
-            ['docker', 'build', '-t', 'github-maintainer-agent:test', '-q', '.'],
-            cwd=PROJECT_ROOT,
-            capture_output=True,
-            timeout=300
-        )
-        
-        # Run container with environment variables
-        result = subprocess.run(
-            [
-                'docker', 'run', '--rm',
-                '-e', 'LOG_LEVEL=DEBUG',
-                '-e', 'MAX_PARALLEL_REPOS=10',
-                'github-maintainer-agent:test',
-                'python', '-c',
-                'import os; print(f"LOG_LEVEL={os.getenv(\'LOG_LEVEL\')}, MAX_PARALLEL_REPOS={os.getenv(\'MAX_PARALLEL_REPOS\')}")'
-            ],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-        
-        assert result.returncode == 0, f"Container failed: {result.stderr}"
-        assert 'LOG_LEVEL=DEBUG' in result.stdout, "LOG_LEVEL not set correctly"
-        assert 'MAX_PARALLEL_REPOS=10' in result.stdout, "MAX_PARALLEL_REPOS not set correctly"
+            container.remove(force=True)
 
 
 class TestDeploymentDocumentation:
     """Tests for deployment documentation."""
     
-    def test_cloud_run_documentation_exists(self):
+    def test_cloud_run_documentation_exists(self, docs_files):
         """Test that Cloud Run deployment documentation exists."""
-        cloud_run_doc = PROJECT_ROOT / "docs" / "DEPLOYMENT_CLOUD_RUN.md"
-        assert cloud_run_doc.exists(), "Cloud Run deployment documentation not found"
+        assert "DEPLOYMENT_CLOUD_RUN.md" in docs_files, \
+            "Cloud Run deployment documentation not found"
     
-    def test_vertex_ai_documentation_exists(self):
+    def test_vertex_ai_documentation_exists(self, docs_files):
         """Test that Vertex AI deployment documentation exists."""
-        vertex_doc = PROJECT_ROOT / "docs" / "DEPLOYMENT_VERTEX_AI.md"
-        assert vertex_doc.exists(), "Vertex AI deployment documentation not found"
+        assert "DEPLOYMENT_VERTEX_AI.md" in docs_files, \
+            "Vertex AI deployment documentation not found"
     
-    def test_kubernetes_manifests_exist(self):
+    def test_kubernetes_manifests_exist(self, repo_files, k8s_files):
         """Test that Kubernetes manifests exist."""
-        k8s_dir = PROJECT_ROOT / "k8s"
-        assert k8s_dir.exists(), "k8s directory not found"
+        assert "k8s" in repo_files, "k8s directory not found"
         
         required_files = [
             'deployment.yaml',
@@ -365,29 +524,23 @@ class TestDeploymentDocumentation:
         ]
         
         for filename in required_files:
-            filepath = k8s_dir / filename
-            assert filepath.exists(), f"Missing Kubernetes manifest: {filename}"
+            assert filename in k8s_files, f"Missing Kubernetes manifest: {filename}"
     
-    def test_kubernetes_readme_exists(self):
+    def test_kubernetes_readme_exists(self, k8s_files):
         """Test that Kubernetes README exists."""
-        k8s_readme = PROJECT_ROOT / "k8s" / "README.md"
-        assert k8s_readme.exists(), "Kubernetes README not found"
+        assert "README.md" in k8s_files, "Kubernetes README not found"
 
 
 class TestDockerIgnore:
     """Tests for .dockerignore configuration."""
     
-    def test_dockerignore_exists(self):
+    def test_dockerignore_exists(self, repo_files):
         """Test that .dockerignore file exists."""
-        dockerignore_path = PROJECT_ROOT / ".dockerignore"
-        assert dockerignore_path.exists(), ".dockerignore not found"
+        assert ".dockerignore" in repo_files, ".dockerignore not found"
     
     def test_dockerignore_excludes_common_files(self):
         """Test that .dockerignore excludes common unnecessary files."""
-        dockerignore_path = PROJECT_ROOT / ".dockerignore"
-        
-        with open(dockerignore_path, 'r') as f:
-            content = f.read()
+        content = (PROJECT_ROOT / ".dockerignore").read_text(encoding='utf-8')
         
         # Check for common exclusions
         common_exclusions = [
@@ -402,15 +555,3 @@ class TestDockerIgnore:
         for exclusion in common_exclusions:
             assert exclusion in content, f"Missing {exclusion} in .dockerignore"
 
-
-# Cleanup function to remove test images
-def pytest_sessionfinish(session, exitstatus):
-    """Cleanup test Docker images after test session."""
-    try:
-        subprocess.run(
-            ['docker', 'rmi', 'github-maintainer-agent:test'],
-            capture_output=True,
-            timeout=30
-        )
-    except Exception:
-        pass  # Ignore cleanup errors
@@ -3,7 +3,6 @@
 import pytest
 from datetime import datetime
 
-from src.models.repository import Repository
 from src.models.health import HealthSnapshot, RepositoryProfile
 from src.models.maintenance import MaintenanceSuggestion
 from evaluation.test_dataset import (
@@ -19,6 +18,9 @@ from evaluation.evaluators import (
 )
 
 
+_FIXED_DT = datetime(2024, 1, 1)
+
+
 class TestTestDataset:
     """Tests for test dataset."""
     
@@ -39,7 +41,7 @@ class TestTestDataset:
         with pytest.raises(ValueError):
             get_test_repository("nonexistent/repo")
     
-    def test_expected_suggestion_matches(self):
+    def test_expected_suggestion_matches(self, repository):
         """Test expected suggestion matching."""
         expected = ExpectedSuggestion(
             category='documentation',
@@ -49,20 +51,9 @@ class TestTestDataset:
         )
         
         # Create matching suggestion
-        repo = Repository(
-            name='test',
-            full_name='test/test',
-            owner='test',
-            url='https://github.com/test/test',
-            default_branch='main',
-            visibility='public',
-            created_at=datetime.now(),
-            updated_at=datetime.now()
-        )
-        
         suggestion = MaintenanceSuggestion(
             id='test-1',
-            repository=repo,
+            repository=repository,
             category='documentation',
             priority='medium',
             title='Improve README documentation',
@@ -74,7 +65,7 @@ class TestTestDataset:
         
         assert expected.matches(suggestion)
     
-    def test_expected_suggestion_no_match(self):
+    def test_expected_suggestion_no_match(self, repository):
         """Test expected suggestion not matching."""
         expected = ExpectedSuggestion(
             category='documentation',
@@ -83,21 +74,10 @@ class TestTestDataset:
             priority='medium'
         )
         
-        repo = Repository(
-            name='test',
-            full_name='test/test',
-            owner='test',
-            url='https://github.com/test/test',
-            default_branch='main',
-            visibility='public',
-            created_at=datetime.now(),
-            updated_at=datetime.now()
-        )
-        
         # Wrong category
         suggestion = MaintenanceSuggestion(
             id='test-1',
-            repository=repo,
+            repository=repository,
             category='bug',
             priority='medium',
             title='Improve README documentation',
@@ -113,23 +93,12 @@ class TestTestDataset:
 class TestDeduplicationEvaluator:
     """Tests for deduplication evaluator."""
     
-    def test_no_duplicates(self):
+    def test_no_duplicates(self, repository):
         """Test evaluation with no duplicates."""
-        repo = Repository(
-            name='test',
-            full_name='test/test',
-            owner='test',
-            url='https://github.com/test/test',
-            default_branch='main',
-            visibility='public',
-            created_at=datetime.now(),
-            updated_at=datetime.now()
-        )
-        
         suggestions1 = [
             MaintenanceSuggestion(
                 id='1',
-                repository=repo,
+                repository=repository,
                 category='documentation',
                 priority='medium',
                 title='Add README',
@@ -143,7 +112,7 @@ class TestDeduplicationEvaluator:
         suggestions2 = [
             MaintenanceSuggestion(
                 id='2',
-                repository=repo,
+                repository=repository,
                 category='enhancement',
                 priority='high',
                 title='Add tests',
@@ -161,23 +130,12 @@ class TestDeduplicationEvaluator:
         assert result.passed
         assert result.details['duplicate_count'] == 0
     
-    def test_with_duplicates(self):
+    def test_with_duplicates(self, repository):
         """Test evaluation with duplicates."""
-        repo = Repository(
-            name='test',
-            full_name='test/test',
-            owner='test',
-            url='https://github.com/test/test',
-            default_branch='main',
-            visibility='public',
-            created_at=datetime.now(),
-            updated_at=datetime.now()
-        )
-        
         suggestions1 = [
             MaintenanceSuggestion(
                 id='1',
-                repository=repo,
+                repository=repository,
                 category='documentation',
                 priority='medium',
                 title='Add README',
@@ -191,7 +149,7 @@ class TestDeduplicationEvaluator:
         suggestions2 = [
             MaintenanceSuggestion(
                 id='2',
-                repository=repo,
+                repository=repository,
                 category='documentation',
                 priority='medium',
                 title='Add README',  # Same title
@@ -217,108 +175,53 @@ class TestDeduplicationEvaluator:
         assert result.passed
 
 
+_COMPLETENESS_TEST_REPO = TestRepository(
+    full_name='test/test',
+    description='Test repository',
+    characteristics={},
+    expected_suggestions=[],
+    expected_health_score_range=(0.8, 1.0),
+    expected_activity_level='active'
+)
+
+
 class TestAnalysisCompletenessEvaluator:
     """Tests for analysis completeness evaluator."""
     
-    def test_complete_analysis(self):
-        """Test evaluation with complete analysis."""
-        repo = Repository(
-            name='test',
-            full_name='test/test',
-            owner='test',
-            url='https://github.com/test/test',
-            default_branch='main',
-            visibility='public',
-            created_at=datetime.now(),
-            updated_at=datetime.now()
-        )
-        
-        health = HealthSnapshot(
-            activity_level='active',
-            test_coverage='good',
-            documentation_quality='excellent',
-            ci_cd_status='configured',
-            dependency_status='current',
-            overall_health_score=0.9,
-            issues_identified=[]
-        )
-        
-        profile = RepositoryProfile(
-            repository=repo,
-            purpose='A test repository',
-            tech_stack=['Python'],
-            key_files=['README.md', 'setup.py'],
-            health=health,
-            last_analyzed=datetime.now(),
-            analysis_version='1.0.0'
-        )
-        
-        test_repo = TestRepository(
-            full_name='test/test',
-            description='Test repository',
-            characteristics={},
-            expected_suggestions=[],
-            expected_health_score_range=(0.8, 1.0),
-            expected_activity_level='active'
-        )
-        
-        evaluator = AnalysisCompletenessEvaluator()
-        result = evaluator.evaluate(profile, test_repo)
-        
-        assert result.score > 0.8
-        assert result.passed
-        assert result.details['health_score_in_range']
-        assert result.details['activity_level_correct']
-    
-    def test_incomplete_analysis(self):
-        """Test evaluation with incomplete analysis."""
-        repo = Repository(
-            name='test',
-            full_name='test/test',
-            owner='test',
-            url='https://github.com/test/test',
-            default_branch='main',
-            visibility='public',
-            created_at=datetime.now(),
-            updated_at=datetime.now()
-        )
-        
+    @pytest.mark.parametrize("activity,health_score,filled,expect_pass", [
+        pytest.param('active', 0.9, True, True, id='complete'),
+        pytest.param('stale', 0.5, False, False, id='incomplete'),
+        pytest.param('active', 0.9, False, True, id='empty-profile-fields'),
+    ])
+    def test_completeness(self, repository, activity, health_score, filled, expect_pass):
+        """Test evaluation across complete and incomplete analyses."""
         health = HealthSnapshot(
-            activity_level='stale',  # Wrong activity level
+            activity_level=activity,
             test_coverage='good',
             documentation_quality='excellent',
             ci_cd_status='configured',
             dependency_status='current',
-            overall_health_score=0.5,  # Out of range
+            overall_health_score=health_score,
             issues_identified=[]
         )
         
         profile = RepositoryProfile(
-            repository=repo,
-            purpose='',  # Empty purpose
-            tech_stack=[],  # Empty tech stack
-            key_files=[],  # Empty key files
+            repository=repository,
+            purpose='A test repository' if filled else '',
+            tech_stack=['Python'] if filled else [],
+            key_files=['README.md', 'setup.py'] if filled else [],
             health=health,
-            last_analyzed=datetime.now(),
+            last_analyzed=_FIXED_DT,
             analysis_version='1.0.0'
         )
         
-        test_repo = TestRepository(
-            full_name='test/test',
-            description='Test repository',
-            characteristics={},
-            expected_suggestions=[],
-            expected_health_score_range=(0.8, 1.0),
-            expected_activity_level='active'
-        )
-        
         evaluator = AnalysisCompletenessEvaluator()
-        result = evaluator.evaluate(profile, test_repo)
+        result = evaluator.evaluate(profile, _COMPLETENESS_TEST_REPO)
         
-        assert result.score < 0.8
-        assert not result.passed
-        assert not result.details['health_score_in_range']
-        assert not result.details['activity_level_correct']
+        assert result.passed is expect_pass
+        assert (result.details['completeness_score'] == 1.0) is filled
+        assert result.details['health_score_in_range'] is (health_score >= 0.8)
+        assert result.details['activity_level_correct'] is (activity == 'active')
 
 
 if __name__ == '__main__':
@@ -0,0 +1,46 @@
+"""Tests for the GitHub API client's HTTP session setup."""
+
+import pytest
+from src.config import Config
+from src.tools import github_client
+from src.tools.github_client import GitHubClient
+
+
+@pytest.fixture
+def config(monkeypatch):
+    """Install a Config with 7 parallel workers as the client's default config."""
+    config = Config(
+        github_token="ghp_" + "x" * 36,
+        gemini_api_key="test_gemini_key",
+        max_parallel_repos=7
+    )
+    monkeypatch.setattr(github_client, "get_config", lambda: config)
+    return config
+
+
+def _pool_maxsize(client, url="https://api.github.com"):
+    """Connection pool size of the adapter the client's session uses for url."""
+    return client.session.get_adapter(url)._pool_maxsize
+
+
+class TestGitHubClientSession:
+    """Tests for the client's pooled session."""
+    
+    def test_session_created_eagerly(self, config):
+        """Test that the session and its auth headers exist before any request."""
+        client = GitHubClient()
+        
+        assert client.session.headers['Authorization'] == f"token {config.github_token}"
+    
+    def test_pool_sized_from_worker_count(self, config):
+        """Test that the pool holds one connection per parallel worker."""
+        client = GitHubClient()
+        
+        assert _pool_maxsize(client) == config.max_parallel_repos
+        assert _pool_maxsize(client, "http://github.example.com/api/v3") == config.max_parallel_repos
+    
+    def test_pool_size_override(self, config):
+        """Test that an explicit pool_size takes precedence over the config."""
+        client = GitHubClient(pool_size=20)
+        
+        assert _pool_maxsize(client) == 20
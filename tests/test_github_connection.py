@@ -2,10 +2,19 @@
 """
 Quick test script to verify GitHub connection and find repos
 """
+import hashlib
+import json
 import os
+import re
+import shelve
 import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, urlencode, urlparse
 from dotenv import load_dotenv
-import requests
+import urllib3
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -13,6 +22,119 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 # Load environment variables
 load_dotenv()
 
+GITHUB_API = 'https://api.github.com'
+
+# ETag cache so repeated runs get 304s, which do not count against the rate limit.
+# Off unless the script is run directly with --cache; pytest runs never touch it.
+# Lives in the temp directory unless PENGUIN_GH_PROBE_CACHE points elsewhere.
+DEFAULT_CACHE_PATH = os.path.join(tempfile.gettempdir(), 'penguin_gh_probe.db')
+_cache_path = None
+# Only the first page of repositories is displayed
+REPOS_PER_PAGE = 10
+_MAX_AGE_RE = re.compile(r'max-age=(\d+)')
+_LINK_RE = re.compile(r'<([^>]+)>;\s*rel="([^"]+)"')
+_cache_lock = threading.Lock()
+
+
+class _Response:
+    """Thin view over a urllib3 response with the fields the probes read."""
+    
+    def __init__(self, raw):
+        self.status_code = raw.status
+        self.headers = raw.headers
+        self._data = raw.data
+        self.links = {
+            rel: {'url': url}
+            for url, rel in _LINK_RE.findall(raw.headers.get('Link', ''))
+        }
+    
+    @property
+    def text(self):
+        return self._data.decode('utf-8', errors='replace')
+    
+    def json(self):
+        return json.loads(self._data)
+
+
+def http_get(http, url, params=None, headers=None):
+    """GET url over the shared pool and wrap the response."""
+    if params:
+        url = f'{url}?{urlencode(params)}'
+    return _Response(http.request('GET', url, headers=headers))
+
+
+class _CachedResponse:
+    """Minimal stand-in for a _Response served from the probe cache."""
+    
+    status_code = 200
+    text = ''
+    
+    def __init__(self, entry):
+        self._body = entry['body']
+        self.links = entry['links']
+    
+    def json(self):
+        return self._body
+
+
+def cached_get(http, url, params=None):
+    """GET url through the on-disk ETag cache, if enabled.
+    
+    Without the cache (the default) this is a plain http_get. Otherwise it
+    sends If-None-Match with the stored ETag and serves the cached body on a
+    304. Entries still fresh under Cache-Control max-age are served without
+    a request. Keys include a hash of the pool's Authorization header so
+    cached responses are never shared between tokens.
+    
+    Args:
+        http: urllib3.PoolManager carrying the Authorization header
+        url: URL to fetch
+        params: Optional query parameters
+        
+    Returns:
+        _Response, or _CachedResponse when served from the cache
+    """
+    if _cache_path is None:
+        return http_get(http, url, params=params)
+    
+    auth = http.headers.get('Authorization', '')
+    key = '{}:{}?{}'.format(
+        hashlib.sha256(auth.encode()).hexdigest()[:16],
+        url,
+        urlencode(sorted((params or {}).items()))
+    )
+    
+    os.makedirs(os.path.dirname(os.path.abspath(_cache_path)), exist_ok=True)
+    with _cache_lock, shelve.open(_cache_path) as cache:
+        entry = cache.get(key)
+    
+    if entry and entry['expires'] > time.time():
+        return _CachedResponse(entry)
+    
+    headers = dict(http.headers)
+    if entry:
+        headers['If-None-Match'] = entry['etag']
+    response = http_get(http, url, params=params, headers=headers)
+    
+    if response.status_code == 304 and entry:
+        result = _CachedResponse(entry)
+    elif response.status_code == 200 and 'ETag' in response.headers:
+        entry = {
+            'etag': response.headers['ETag'],
+            'body': response.json(),
+            'links': response.links,
+        }
+        result = response
+    else:
+        return response
+    
+    match = _MAX_AGE_RE.search(response.headers.get('Cache-Control', ''))
+    entry['expires'] = time.time() + int(match.group(1)) if match else 0
+    with _cache_lock, shelve.open(_cache_path) as cache:
+        cache[key] = entry
+    return result
+
+
 def test_github_connection():
     """Test GitHub API connection and list repos"""
     
@@ -28,12 +150,43 @@ def test_github_connection():
     print("GitHub Connection Test")
     print("=" * 80)
     
+    # One raw urllib3 pool so every probe reuses the same TLS connections
+    # without the per-call overhead of the requests layer
+    with urllib3.PoolManager(
+        num_pools=1,
+        maxsize=4,
+        headers={'Authorization': f'token {token}', 'Accept': 'application/vnd.github.v3+json'}
+    ) as http:
+        _run_probes(http)
+
+
+def _count_repos(http, first_page, first_page_len):
+    """Count repositories from the first page's Link header.
+    
+    Only the last page is fetched, so large accounts are counted without
+    downloading every page.
+    """
+    last = first_page.links.get('last')
+    if not last:
+        return first_page_len
+    
+    query = parse_qs(urlparse(last['url']).query)
+    last_page = int(query['page'][0])
+    per_page = int(query.get('per_page', [REPOS_PER_PAGE])[0])
+    response = cached_get(http, last['url'])
+    if response.status_code != 200:
+        # Upper bound when the last page cannot be read
+        return last_page * per_page
+    return (last_page - 1) * per_page + len(response.json())
+
+
+def _run_probes(http):
+    """Run the connection probes over a shared connection pool."""
     # Test 1: Verify token
     print("\n1. Testing GitHub token...")
-    headers = {'Authorization': f'token {token}'}
     
     try:
-        response = requests.get('https://api.github.com/user', headers=headers)
+        response = cached_get(http, f'{GITHUB_API}/user')
         
         if response.status_code == 200:
             user_data = response.json()
@@ -53,29 +206,43 @@ def test_github_connection():
         print(f"   ❌ Connection error: {e}")
         return
     
+    # The remaining probes are independent, so issue them concurrently over the
+    # connection pool and report the results in order once they have all arrived
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        repos_future = executor.submit(
+            cached_get,
+            http,
+            f'{GITHUB_API}/users/{authenticated_user}/repos',
+            params={'per_page': REPOS_PER_PAGE, 'sort': 'updated'}
+        )
+        rate_future = executor.submit(http_get, http, f'{GITHUB_API}/rate_limit')
+        octocat_future = executor.submit(
+            cached_get,
+            http,
+            f'{GITHUB_API}/users/octocat/repos',
+            params={'per_page': 5}
+        )
+    
     # Test 2: List your own repos
     print(f"\n2. Fetching repositories for {authenticated_user}...")
     
     try:
-        response = requests.get(
-            f'https://api.github.com/users/{authenticated_user}/repos',
-            headers=headers,
-            params={'per_page': 100, 'sort': 'updated'}
-        )
+        response = repos_future.result()
         
         if response.status_code == 200:
             repos = response.json()
-            print(f"   ✓ Found {len(repos)} repositories")
+            total = _count_repos(http, response, len(repos))
+            print(f"   ✓ Found {total} repositories")
             
             if repos:
                 print("\n   Your repositories:")
-                for i, repo in enumerate(repos[:10], 1):  # Show first 10
+                for i, repo in enumerate(repos, 1):
                     visibility = "🔒 Private" if repo['private'] else "🌐 Public"
                     updated = repo['updated_at'][:10]
                     print(f"   {i}. {repo['name']} ({visibility}) - Updated: {updated}")
                 
-                if len(repos) > 10:
-                    print(f"   ... and {len(repos) - 10} more")
+                if total > len(repos):
+                    print(f"   ... and {total - len(repos)} more")
             else:
                 print("   ⚠️  No repositories found")
                 print("   This account has no repositories yet")
@@ -91,7 +258,7 @@ def test_github_connection():
     print("\n3. Checking API rate limits...")
     
     try:
-        response = requests.get('https://api.github.com/rate_limit', headers=headers)
+        response = rate_future.result()
         
         if response.status_code == 200:
             rate_data = response.json()
@@ -107,11 +274,7 @@ def test_github_connection():
     print("\n4. Testing with a known GitHub user (octocat)...")
     
     try:
-        response = requests.get(
-            'https://api.github.com/users/octocat/repos',
-            headers=headers,
-            params={'per_page': 5}
-        )
+        response = octocat_future.result()
         
         if response.status_code == 200:
             repos = response.json()
@@ -132,5 +295,8 @@ def test_github_connection():
     print("   2. Or try a public user: python main.py analyze octocat")
     print("   3. Add filters: python main.py analyze {authenticated_user} --language Python")
 
+
 if __name__ == '__main__':
+    if '--cache' in sys.argv[1:]:
+        _cache_path = os.getenv('PENGUIN_GH_PROBE_CACHE') or DEFAULT_CACHE_PATH
     test_github_connection()
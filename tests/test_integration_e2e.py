@@ -4,10 +4,14 @@ This module contains comprehensive integration tests that verify the entire
 system works correctly with real GitHub API calls and LLM interactions.
 """
 
+import json
+import operator
 import os
 import sys
 import pytest
 import logging
+import requests
+import responses
 from datetime import datetime
 from typing import List, Optional
 from unittest.mock import Mock, patch, MagicMock
@@ -22,7 +26,8 @@ from src.models.repository import Repository
 from src.models.health import HealthSnapshot, RepositoryProfile
 from src.models.maintenance import MaintenanceSuggestion
 from src.models.session import UserPreferences, SessionState
-from src.tools.github_tools import RepositoryFilters
+from src.tools.github_tools import RepositoryFilters, list_repos, get_repo_overview
+from src.tools.github_client import GitHubAPIError, RateLimitError
 from src.memory.memory_bank import MemoryBank
 from src.memory.session_service import SessionService
 from src.config import get_config
@@ -33,59 +38,79 @@ TEST_USERNAME = os.getenv("TEST_GITHUB_USERNAME", "octocat")
 SKIP_REAL_API = os.getenv("SKIP_REAL_API_TESTS", "true").lower() == "true"
 
 
+@pytest.fixture(scope="session")
+def memory_bank(tmp_path_factory):
+    """Provide a memory bank backed by a temporary directory for the session.
+    
+    Under pytest-xdist each worker has its own base temp directory, so
+    workers never share profile or preference files.
+    """
+    return MemoryBank(storage_dir=str(tmp_path_factory.mktemp("mem")))
+
+
+@pytest.fixture(scope="session")
+def mock_config(memory_bank):
+    """Provide a mock configuration for testing."""
+    config = MagicMock()
+    config.github_token = "ghp_" + "x" * 36
+    config.gemini_api_key = "test_key_1234567890"
+    config.log_level = "INFO"
+    config.memory_dir = str(memory_bank.storage_dir)
+    return config
+
+
+@pytest.fixture(scope="session")
+def coordinator(mock_config, memory_bank):
+    """Provide a Coordinator Agent wired once for the whole session."""
+    with patch('src.agents.coordinator.get_config', return_value=mock_config):
+        return CoordinatorAgent(memory_bank=memory_bank)
+
+
+@pytest.fixture(scope="session")
+def analyzer(mock_config):
+    """Provide an Analyzer Agent shared by the session."""
+    with patch('src.agents.analyzer.get_config', return_value=mock_config):
+        return AnalyzerAgent()
+
+
+@pytest.fixture(scope="session")
+def maintainer(mock_config, memory_bank):
+    """Provide a Maintainer Agent shared by the session."""
+    with patch('src.agents.maintainer.get_config', return_value=mock_config):
+        return MaintainerAgent(memory_bank=memory_bank)
+
+
+@pytest.fixture(scope="session")
+def sample_health_snapshot():
+    """Provide a sample health snapshot for testing."""
+    return HealthSnapshot(
+        activity_level="moderate",
+        test_coverage="none",
+        documentation_quality="basic",
+        ci_cd_status="missing",
+        dependency_status="unknown",
+        overall_health_score=0.45,
+        issues_identified=["No tests detected", "No CI/CD configuration"]
+    )
+
+
+@pytest.fixture
+def sample_profile(repository, sample_health_snapshot):
+    """Provide a sample repository profile for testing."""
+    return RepositoryProfile(
+        repository=repository,
+        purpose="A test repository for demonstration",
+        tech_stack=["Python", "JavaScript"],
+        key_files=["README.md", "setup.py", "package.json"],
+        health=sample_health_snapshot,
+        last_analyzed=datetime.now(),
+        analysis_version="1.0.0"
+    )
+
+
 class TestEndToEndIntegration:
     """End-to-end integration tests for the complete system."""
     
-    @pytest.fixture
-    def mock_config(self):
-        """Provide a mock configuration for testing."""
-        config = MagicMock()
-        config.github_token = "ghp_" + "x" * 36
-        config.gemini_api_key = "test_key_1234567890"
-        config.log_level = "INFO"
-        config.memory_dir = ".test_memory"
-        return config
-    
-    @pytest.fixture
-    def sample_repository(self):
-        """Provide a sample repository for testing."""
-        return Repository(
-            name="test-repo",
-            full_name="test-user/test-repo",
-            owner="test-user",
-            url="https://github.com/test-user/test-repo",
-            default_branch="main",
-            visibility="public",
-            created_at=datetime(2023, 1, 1),
-            updated_at=datetime(2024, 1, 1)
-        )
-    
-    @pytest.fixture
-    def sample_health_snapshot(self):
-        """Provide a sample health snapshot for testing."""
-        return HealthSnapshot(
-            activity_level="moderate",
-            test_coverage="none",
-            documentation_quality="basic",
-            ci_cd_status="missing",
-            dependency_status="unknown",
-            overall_health_score=0.45,
-            issues_identified=["No tests detected", "No CI/CD configuration"]
-        )
-    
-    @pytest.fixture
-    def sample_profile(self, sample_repository, sample_health_snapshot):
-        """Provide a sample repository profile for testing."""
-        return RepositoryProfile(
-            repository=sample_repository,
-            purpose="A test repository for demonstration",
-            tech_stack=["Python", "JavaScript"],
-            key_files=["README.md", "setup.py", "package.json"],
-            health=sample_health_snapshot,
-            last_analyzed=datetime.now(),
-            analysis_version="1.0.0"
-        )
-    
     @pytest.fixture
     def user_preferences(self):
         """Provide user preferences for testing."""
@@ -97,93 +122,76 @@ class TestEndToEndIntegration:
             focus_areas=["tests", "docs", "security"]
         )
     
-    def test_coordinator_initialization(self, mock_config):
-        """Test that Coordinator Agent can be initialized."""
-        with patch('src.agents.coordinator.get_config', return_value=mock_config):
-            coordinator = CoordinatorAgent()
-            
-            assert coordinator is not None
-            assert coordinator.workflow is not None
-            assert len(coordinator.workflow) == 7
-            assert coordinator.session_service is not None
-    
-    def test_analyzer_initialization(self, mock_config):
-        """Test that Analyzer Agent can be initialized."""
-        with patch('src.agents.analyzer.get_config', return_value=mock_config):
-            analyzer = AnalyzerAgent()
-            
-            assert analyzer is not None
-            assert analyzer.github_client is not None
+    @pytest.mark.parametrize("agent_fixture,attrs", [
+        ("coordinator", ("workflow", "session_service")),
+        ("analyzer", ("github_client",)),
+        ("maintainer", ("memory_bank",)),
+    ])
+    def test_agent_initialization(self, request, agent_fixture, attrs):
+        """Test that each agent can be initialized with its collaborators."""
+        agent = request.getfixturevalue(agent_fixture)
+        
+        assert agent is not None
+        for attr in attrs:
+            assert getattr(agent, attr) is not None
     
-    def test_maintainer_initialization(self, mock_config):
-        """Test that Maintainer Agent can be initialized."""
-        with patch('src.agents.maintainer.get_config', return_value=mock_config):
-            memory_bank = MemoryBank(storage_dir=".test_memory")
-            maintainer = MaintainerAgent(memory_bank=memory_bank)
-            
-            assert maintainer is not None
-            assert maintainer.memory_bank is not None
+    def test_coordinator_workflow_stages(self, coordinator):
+        """Test that the coordinator wires all seven workflow stages."""
+        assert len(coordinator.workflow) == 7
     
-    def test_workflow_state_transitions(self, mock_config):
+    def test_workflow_state_transitions(self, coordinator):
         """Test that workflow state transitions work correctly."""
-        with patch('src.agents.coordinator.get_config', return_value=mock_config):
-            coordinator = CoordinatorAgent()
-            
-            # Test state initialization
-            from src.agents.coordinator import WorkflowState
-            state = WorkflowState(username="test-user")
-            
-            assert state.username == "test-user"
-            assert state.stage == "initialization"
-            assert len(state.repositories) == 0
-            assert len(state.suggestions) == 0
-            assert len(state.issues_created) == 0
+        # Test state initialization
+        from src.agents.coordinator import WorkflowState
+        state = WorkflowState(username="test-user")
+        
+        assert state.username == "test-user"
+        assert state.stage == "initialization"
+        assert len(state.repositories) == 0
+        assert len(state.suggestions) == 0
+        assert len(state.issues_created) == 0
     
-    def test_progress_event_emission(self, mock_config):
+    def test_progress_event_emission(self, coordinator):
         """Test that progress events are emitted correctly."""
         events_received = []
         
         def progress_callback(event: ProgressEvent):
             events_received.append(event)
         
-        with patch('src.agents.coordinator.get_config', return_value=mock_config):
-            coordinator = CoordinatorAgent()
-            
-            # Mock the workflow to emit events
-            from src.agents.coordinator import WorkflowState
-            state = WorkflowState(username="test-user")
-            
-            # Simulate progress events
-            event1 = ProgressEvent(
-                stage="initialization",
-                message="Starting analysis",
-                current=0,
-                total=0
-            )
-            progress_callback(event1)
-            
-            event2 = ProgressEvent(
-                stage="fetching",
-                message="Fetching repositories",
-                current=1,
-                total=5
-            )
-            progress_callback(event2)
-            
-            assert len(events_received) == 2
-            assert events_received[0].stage == "initialization"
-            assert events_received[1].stage == "fetching"
-            assert events_received[1].current == 1
-            assert events_received[1].total == 5
+        # Mock the workflow to emit events
+        from src.agents.coordinator import WorkflowState
+        state = WorkflowState(username="test-user")
+        
+        # Simulate progress events
+        event1 = ProgressEvent(
+            stage="initialization",
+            message="Starting analysis",
+            current=0,
+            total=0
+        )
+        progress_callback(event1)
+        
+        event2 = ProgressEvent(
+            stage="fetching",
+            message="Fetching repositories",
+            current=1,
+            total=5
+        )
+        progress_callback(event2)
+        
+        assert len(events_received) == 2
+        assert events_received[0].stage == "initialization"
+        assert events_received[1].stage == "fetching"
+        assert events_received[1].current == 1
+        assert events_received[1].total == 5
     
     def test_suggestion_generation_and_prioritization(
-        self, mock_config, sample_profile, user_preferences
+        self, mock_config, sample_profile, user_preferences, memory_bank
     ):
         """Test that suggestions are generated and prioritized correctly."""
         with patch('src.agents.maintainer.get_config', return_value=mock_config), \
              patch('src.agents.maintainer.genai'):
             
-            memory_bank = MemoryBank(storage_dir=".test_memory")
             maintainer = MaintainerAgent(memory_bank=memory_bank)
             
             # Generate suggestions using fallback (no LLM call)
@@ -198,24 +206,17 @@ class TestEndToEndIntegration:
             assert len(prioritized) == len(suggestions)
             
             # Verify priority ordering (high -> medium -> low)
-            priorities = [s.priority for s in prioritized]
-            high_indices = [i for i, p in enumerate(priorities) if p == "high"]
-            medium_indices = [i for i, p in enumerate(priorities) if p == "medium"]
-            low_indices = [i for i, p in enumerate(priorities) if p == "low"]
-            
-            if high_indices and medium_indices:
-                assert max(high_indices) < min(medium_indices)
-            if medium_indices and low_indices:
-                assert max(medium_indices) < min(low_indices)
+            rank = {"high": 0, "medium": 1, "low": 2}
+            ranks = [rank[s.priority] for s in prioritized]
+            assert all(a <= b for a, b in zip(ranks, ranks[1:]))
     
     def test_deduplication_within_session(
-        self, mock_config, sample_profile, sample_repository
+        self, mock_config, sample_profile, repository, memory_bank
     ):
         """Test that duplicate suggestions are removed within a session."""
         with patch('src.agents.maintainer.get_config', return_value=mock_config), \
              patch('src.agents.maintainer.genai'):
             
-            memory_bank = MemoryBank(storage_dir=".test_memory")
             maintainer = MaintainerAgent(memory_bank=memory_bank)
             
             # Generate suggestions
@@ -226,57 +227,53 @@ class TestEndToEndIntegration:
             
             # Deduplicate
             unique = maintainer._deduplicate_suggestions(
-                sample_repository.full_name,
+                repository.full_name,
                 duplicates
             )
             
             # Should have removed duplicates
             assert len(unique) <= len(suggestions)
     
-    def test_session_state_persistence(self, mock_config):
+    def test_session_state_persistence(self, coordinator):
         """Test that session state is persisted correctly."""
-        with patch('src.agents.coordinator.get_config', return_value=mock_config):
-            coordinator = CoordinatorAgent()
-            session_service = coordinator.session_service
-            
-            # Create a session
-            session_id = "test-session-123"
-            state = SessionState(
-                session_id=session_id,
-                username="test-user",
-                repositories_analyzed=["repo1", "repo2"],
-                suggestions_generated=[],
-                issues_created=[],
-                start_time=datetime.now()
-            )
-            
-            # Save session
-            session_service.save_session(session_id, state)
-            
-            # Retrieve session
-            retrieved = session_service.get_session(session_id)
-            
-            assert retrieved is not None
-            assert retrieved.session_id == session_id
-            assert retrieved.username == "test-user"
-            assert len(retrieved.repositories_analyzed) == 2
+        session_service = coordinator.session_service
+        
+        # Create a session
+        session_id = "test-session-123"
+        state = SessionState(
+            session_id=session_id,
+            username="test-user",
+            repositories_analyzed=["repo1", "repo2"],
+            suggestions_generated=[],
+            issues_created=[],
+            start_time=datetime.now()
+        )
+        
+        # Save session
+        session_service.save_session(session_id, state)
+        
+        # Retrieve session
+        retrieved = session_service.get_session(session_id)
+        
+        assert retrieved is not None
+        assert retrieved.session_id == session_id
+        assert retrieved.username == "test-user"
+        assert len(retrieved.repositories_analyzed) == 2
     
-    def test_error_handling_graceful_degradation(self, mock_config, sample_repository):
+    def test_error_handling_graceful_degradation(
+        self, analyzer, repository, monkeypatch
+    ):
         """Test that errors are handled gracefully without crashing."""
-        with patch('src.agents.analyzer.get_config', return_value=mock_config):
-            analyzer = AnalyzerAgent()
-            
-            # Mock GitHub client to raise an error
-            analyzer.github_client.get_repo_overview = Mock(
-                side_effect=Exception("API Error")
-            )
-            
-            # Should not crash, should return None or handle gracefully
-            try:
-                result = analyzer.github_client.get_repo_overview(sample_repository.full_name)
-                assert False, "Should have raised an exception"
-            except Exception as e:
-                assert "API Error" in str(e)
+        # Mock the GitHub client's GET to raise an error
+        monkeypatch.setattr(
+            analyzer.github_client,
+            'get',
+            Mock(side_effect=GitHubAPIError("API Error"))
+        )
+        
+        # The error surfaces as a GitHubAPIError instead of crashing elsewhere
+        with pytest.raises(GitHubAPIError, match="API Error"):
+            get_repo_overview(repository.full_name, client=analyzer.github_client)
     
     def test_filter_application(self, mock_config):
         """Test that repository filters are applied correctly."""
@@ -312,30 +309,16 @@ class TestEndToEndIntegration:
         ]
         
         # Apply filters manually (since we're testing the logic)
-        filtered = [
-            r for r in repos
-            if r.updated_at >= datetime(2024, 1, 1)
-        ]
+        updated_at = operator.attrgetter('updated_at')
+        threshold = datetime(2024, 1, 1)
+        filtered = [r for r in repos if updated_at(r) >= threshold]
         
         assert len(filtered) == 1
         assert filtered[0].name == "python-repo"
     
-    def test_memory_bank_operations(self, mock_config):
+    def test_memory_bank_operations(self, mock_config, memory_bank, repository):
         """Test memory bank CRUD operations."""
-        memory_bank = MemoryBank(storage_dir=".test_memory")
-        
         # Create test profile
-        repo = Repository(
-            name="test-repo",
-            full_name="user/test-repo",
-            owner="user",
-            url="https://github.com/user/test-repo",
-            default_branch="main",
-            visibility="public",
-            created_at=datetime(2023, 1, 1),
-            updated_at=datetime(2024, 1, 1)
-        )
-        
         health = HealthSnapshot(
             activity_level="active",
             test_coverage="good",
@@ -347,7 +330,7 @@ class TestEndToEndIntegration:
         )
         
         profile = RepositoryProfile(
-            repository=repo,
+            repository=repository,
             purpose="Test repository",
             tech_stack=["Python"],
             key_files=["README.md"],
@@ -360,16 +343,14 @@ class TestEndToEndIntegration:
         memory_bank.save_repository_profile(profile)
         
         # Load profile
-        loaded = memory_bank.load_repository_profile(repo.full_name)
+        loaded = memory_bank.load_repository_profile(repository.full_name)
         
         assert loaded is not None
-        assert loaded.repository.full_name == repo.full_name
+        assert loaded.repository.full_name == repository.full_name
         assert loaded.purpose == profile.purpose
     
-    def test_user_preferences_persistence(self, mock_config):
+    def test_user_preferences_persistence(self, mock_config, memory_bank):
         """Test that user preferences are persisted correctly."""
-        memory_bank = MemoryBank(storage_dir=".test_memory")
-        
         # Create preferences
         preferences = UserPreferences(
             user_id="test-user",
@@ -392,6 +373,7 @@ class TestEndToEndIntegration:
         assert len(loaded.excluded_repos) == 2
         assert len(loaded.focus_areas) == 2
     
+    @pytest.mark.xdist_group("real_api")
     @pytest.mark.skipif(SKIP_REAL_API, reason="Skipping real API tests")
     def test_real_github_api_integration(self):
         """Test integration with real GitHub API (requires valid token)."""
@@ -415,6 +397,7 @@ class TestEndToEndIntegration:
         except ValueError as e:
             pytest.skip(f"GitHub token not configured: {e}")
     
+    @pytest.mark.xdist_group("real_api")
     @pytest.mark.skipif(SKIP_REAL_API, reason="Skipping real API tests")
     def test_real_end_to_end_workflow(self):
         """Test complete end-to-end workflow with real APIs (requires valid tokens)."""
@@ -462,48 +445,54 @@ class TestEndToEndIntegration:
 class TestErrorScenarios:
     """Test error handling and edge cases."""
     
+    @responses.activate
     def test_invalid_github_token(self):
         """Test handling of invalid GitHub token."""
-        from src.tools.github_client import GitHubClient
+        from src.tools.github_client import GitHubClient, AuthenticationError
+        from src.tools.github_tools import list_repos
         
-        client = GitHubClient("invalid_token")
+        # GitHub answers a bad token with 401; served in-process, no network
+        responses.add(
+            responses.GET,
+            'https://api.github.com/users/octocat/repos',
+            json={'message': 'Bad credentials'},
+            status=401
+        )
+        client = GitHubClient("invalid_token", base_url='https://api.github.com')
         
         # Should handle authentication error gracefully
-        with pytest.raises(Exception):
-            client.list_repos("octocat")
+        with pytest.raises(AuthenticationError):
+            list_repos("octocat", client=client)
     
-    def test_rate_limit_handling(self, mock_config):
+    def test_rate_limit_handling(self, analyzer, monkeypatch):
         """Test handling of GitHub API rate limits."""
-        with patch('src.agents.analyzer.get_config', return_value=mock_config):
-            analyzer = AnalyzerAgent()
-            
-            # Mock rate limit response
-            analyzer.github_client.list_repos = Mock(
-                side_effect=Exception("API rate limit exceeded")
-            )
-            
-            # Should handle rate limit error
-            with pytest.raises(Exception) as exc_info:
-                analyzer.github_client.list_repos("test-user")
-            
-            assert "rate limit" in str(exc_info.value).lower()
+        # Mock rate limit response
+        monkeypatch.setattr(
+            analyzer.github_client,
+            'get_paginated',
+            Mock(side_effect=RateLimitError("API rate limit exceeded"))
+        )
+        
+        # Should handle rate limit error
+        with pytest.raises(RateLimitError) as exc_info:
+            list_repos("test-user", client=analyzer.github_client)
+        
+        assert "rate limit" in str(exc_info.value).lower()
     
-    def test_empty_repository_list(self, mock_config):
+    def test_empty_repository_list(self, coordinator):
         """Test handling of empty repository list."""
-        with patch('src.agents.coordinator.get_config', return_value=mock_config):
-            coordinator = CoordinatorAgent()
+        # Mock empty repository list
+        with patch.object(
+            coordinator.github_client,
+            'get_paginated',
+            return_value=[]
+        ):
+            from src.agents.coordinator import WorkflowState
+            state = WorkflowState(username="test-user")
             
-            # Mock empty repository list
-            with patch.object(
-                coordinator.analyzer.github_client,
-                'list_repos',
-                return_value=[]
-            ):
-                from src.agents.coordinator import WorkflowState
-                state = WorkflowState(username="test-user")
-                
-                # Should handle empty list gracefully
-                assert len(state.repositories) == 0
+            # Should handle empty list gracefully
+            assert list_repos("test-user", client=coordinator.github_client) == []
+            assert len(state.repositories) == 0
     
     def test_malformed_repository_data(self, mock_config):
         """Test handling of malformed repository data."""
@@ -514,39 +503,33 @@ class TestErrorScenarios:
                 # Missing required fields
             )
     
-    def test_network_error_retry(self, mock_config):
+    def test_network_error_retry(self, analyzer, monkeypatch):
         """Test retry logic for network errors."""
-        with patch('src.agents.analyzer.get_config', return_value=mock_config):
-            analyzer = AnalyzerAgent()
-            
-            # Mock network error
-            analyzer.github_client.get_repo_overview = Mock(
-                side_effect=Exception("Network error")
-            )
-            
-            # Should raise error after retries
-            with pytest.raises(Exception):
-                analyzer.github_client.get_repo_overview("user/repo")
+        # Mock network error on every attempt; skip the backoff sleeps
+        request = Mock(side_effect=requests.exceptions.ConnectionError("Network error"))
+        monkeypatch.setattr(analyzer.github_client.session, 'request', request)
+        monkeypatch.setattr('src.tools.github_client.time.sleep', Mock())
+        
+        # Should raise error after retries
+        with pytest.raises(GitHubAPIError, match="Network error"):
+            analyzer.github_client.get("/repos/user/repo")
+        assert request.call_count == 3
 
 
 class TestPerformanceOptimizations:
     """Test performance optimizations."""
     
-    def test_parallel_repository_processing(self, mock_config):
+    def test_parallel_repository_processing(self, coordinator):
         """Test that repositories are processed in parallel."""
-        with patch('src.agents.coordinator.get_config', return_value=mock_config):
-            coordinator = CoordinatorAgent()
-            
-            # The coordinator should support parallel processing
-            # This is verified by checking the workflow implementation
-            assert coordinator.workflow is not None
+        # The coordinator should support parallel processing
+        # This is verified by checking the workflow implementation
+        assert coordinator.workflow is not None
     
-    def test_context_compaction(self, mock_config, sample_profile):
+    def test_context_compaction(self, mock_config, sample_profile, memory_bank):
         """Test that context is compacted for large repositories."""
         with patch('src.agents.maintainer.get_config', return_value=mock_config), \
              patch('src.agents.maintainer.genai'):
             
-            memory_bank = MemoryBank(memory_dir=".test_memory")
             maintainer = MaintainerAgent(memory_bank=memory_bank)
             
             # Create context
@@ -559,8 +542,7 @@ class TestPerformanceOptimizations:
             assert 'tech_stack' in context
             
             # Should not include large data structures
-            context_str = str(context)
-            assert len(context_str) < 10000  # Reasonable size limit
+            assert len(json.dumps(context, default=str)) < 10000  # Reasonable size limit
 
 
 if __name__ == "__main__":
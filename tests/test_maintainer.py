@@ -9,7 +9,6 @@ from src.models.repository import Repository
 from src.models.health import HealthSnapshot, RepositoryProfile
 from src.models.maintenance import MaintenanceSuggestion, IssueResult
 from src.models.session import UserPreferences
-from src.memory.memory_bank import MemoryBank
 
 
 @pytest.fixture
@@ -70,13 +69,24 @@ def mock_user_preferences():
     )
 
 
+class FakeMemoryBank:
+    """Stand-in for MemoryBank implementing only the suggestion methods."""
+    
+    def __init__(self):
+        self.suggestions = []
+        self.saved = []
+    
+    def load_suggestions(self, repo_full_name):
+        return list(self.suggestions)
+    
+    def save_suggestions(self, repo_full_name, suggestions):
+        self.saved.append((repo_full_name, suggestions))
+
+
 @pytest.fixture
 def mock_memory_bank():
-    """Create a mock memory bank."""
-    memory = Mock(spec=MemoryBank)
-    memory.load_suggestions.return_value = []
-    memory.save_suggestions.return_value = None
-    return memory
+    """Create a fake memory bank."""
+    return FakeMemoryBank()
 
 
 @pytest.fixture
@@ -109,14 +119,11 @@ def test_maintainer_agent_initialization(maintainer_agent):
 
 def test_generate_suggestion_id(maintainer_agent):
     """Test suggestion ID generation."""
-    import time
-    
     id1 = maintainer_agent._generate_suggestion_id("repo1", "title1")
-    time.sleep(0.001)  # Small delay to ensure different timestamp
     id2 = maintainer_agent._generate_suggestion_id("repo1", "title1")
     id3 = maintainer_agent._generate_suggestion_id("repo2", "title1")
     
-    # IDs should be unique (due to timestamp)
+    # IDs should be unique (due to the per-process counter)
     assert id1 != id2
     # Different repos should produce different IDs
     assert id1 != id3
@@ -196,7 +203,7 @@ def test_deduplicate_suggestions(maintainer_agent, mock_repository):
     )
     
     # Mock memory bank to return existing suggestion
-    maintainer_agent.memory_bank.load_suggestions.return_value = [existing_suggestion]
+    maintainer_agent.memory_bank.suggestions = [existing_suggestion]
     
     new_suggestions = [
         MaintenanceSuggestion(
@@ -233,6 +240,31 @@ def test_deduplicate_suggestions(maintainer_agent, mock_repository):
     assert unique[0].title == "Add new feature"
 
 
+def test_deduplicate_suggestions_within_batch(maintainer_agent, mock_repository):
+    """Test that repeated titles within one batch are deduplicated."""
+    new_suggestions = [
+        MaintenanceSuggestion(
+            id=f"new{i}",
+            repository=mock_repository,
+            category="documentation",
+            priority="low",
+            title=title,
+            description="Write docs",
+            rationale="Docs",
+            estimated_effort="small",
+            labels=["documentation"]
+        )
+        for i, title in enumerate(["Add README", "add readme ", "Add LICENSE"])
+    ]
+
+    unique = maintainer_agent._deduplicate_suggestions(
+        mock_repository.full_name,
+        new_suggestions
+    )
+
+    assert [s.id for s in unique] == ["new0", "new2"]
+
+
 def test_format_issue_body(maintainer_agent, mock_repository):
     """Test issue body formatting."""
     suggestion = MaintenanceSuggestion(
@@ -285,7 +317,7 @@ def test_create_github_issue_success(maintainer_agent, mock_repository, mock_use
         assert result.issue_number == 1
         
         # Verify suggestion was saved to memory
-        maintainer_agent.memory_bank.save_suggestions.assert_called_once()
+        assert len(maintainer_agent.memory_bank.saved) == 1
 
 
 def test_create_github_issue_failure(maintainer_agent, mock_repository):
@@ -317,7 +349,7 @@ def test_create_github_issue_failure(maintainer_agent, mock_repository):
         assert result.error_message == "API error"
         
         # Verify suggestion was NOT saved to memory
-        maintainer_agent.memory_bank.save_suggestions.assert_not_called()
+        assert maintainer_agent.memory_bank.saved == []
 
 
 def test_prepare_suggestion_context(maintainer_agent, mock_profile, mock_user_preferences):
@@ -1,5 +1,6 @@
 """Unit tests for data models."""
 
+import re
 import pytest
 from datetime import datetime
 from src.models import (
@@ -15,6 +16,7 @@ from src.models import (
     SessionState,
     UserPreferences,
 )
+from tests.conftest import make_repository
 
 
 class TestRepository:
@@ -34,48 +36,6 @@ class TestRepository:
         )
         assert repo.name == "test-repo"
         assert repo.visibility == "public"
-    
-    def test_repository_validation(self):
-        """Test repository validation."""
-        repo = Repository(
-            name="test-repo",
-            full_name="user/test-repo",
-            owner="user",
-            url="https://github.com/user/test-repo",
-            default_branch="main",
-            visibility="public",
-            created_at=datetime(2024, 1, 1),
-            updated_at=datetime(2024, 11, 29)
-        )
-        repo.validate()  # Should not raise
-        
-        # Test invalid visibility
-        repo.visibility = "invalid"
-        with pytest.raises(ValueError, match="Invalid visibility"):
-            repo.validate()
-    
-    def test_repository_serialization(self):
-        """Test repository serialization/deserialization."""
-        repo = Repository(
-            name="test-repo",
-            full_name="user/test-repo",
-            owner="user",
-            url="https://github.com/user/test-repo",
-            default_branch="main",
-            visibility="public",
-            created_at=datetime(2024, 1, 1),
-            updated_at=datetime(2024, 11, 29)
-        )
-        
-        # Test dict round-trip
-        repo_dict = repo.to_dict()
-        repo_restored = Repository.from_dict(repo_dict)
-        assert repo == repo_restored
-        
-        # Test JSON round-trip
-        repo_json = repo.to_json()
-        repo_from_json = Repository.from_json(repo_json)
-        assert repo == repo_from_json
 
 
 class TestHealthSnapshot:
@@ -94,61 +54,16 @@ class TestHealthSnapshot:
         )
         assert health.activity_level == "active"
         assert health.overall_health_score == 0.9
-    
-    def test_health_snapshot_validation(self):
-        """Test health snapshot validation."""
-        health = HealthSnapshot(
-            activity_level="active",
-            test_coverage="good",
-            documentation_quality="excellent",
-            ci_cd_status="configured",
-            dependency_status="current",
-            overall_health_score=0.9,
-            issues_identified=[]
-        )
-        health.validate()  # Should not raise
-        
-        # Test invalid score
-        health.overall_health_score = 1.5
-        with pytest.raises(ValueError, match="must be between 0.0 and 1.0"):
-            health.validate()
-    
-    def test_health_snapshot_serialization(self):
-        """Test health snapshot serialization."""
-        health = HealthSnapshot(
-            activity_level="moderate",
-            test_coverage="partial",
-            documentation_quality="good",
-            ci_cd_status="missing",
-            dependency_status="outdated",
-            overall_health_score=0.6,
-            issues_identified=["Missing tests", "Outdated dependencies"]
-        )
-        
-        health_dict = health.to_dict()
-        health_restored = HealthSnapshot.from_dict(health_dict)
-        assert health == health_restored
 
 
 class TestMaintenanceSuggestion:
     """Test MaintenanceSuggestion model."""
     
-    def test_suggestion_creation(self):
+    def test_suggestion_creation(self, repository):
         """Test creating a maintenance suggestion."""
-        repo = Repository(
-            name="test-repo",
-            full_name="user/test-repo",
-            owner="user",
-            url="https://github.com/user/test-repo",
-            default_branch="main",
-            visibility="public",
-            created_at=datetime(2024, 1, 1),
-            updated_at=datetime(2024, 11, 29)
-        )
-        
         suggestion = MaintenanceSuggestion(
             id="sug-001",
-            repository=repo,
+            repository=repository,
             category="documentation",
             priority="high",
             title="Add README",
@@ -159,37 +74,6 @@ class TestMaintenanceSuggestion:
         )
         assert suggestion.category == "documentation"
         assert suggestion.priority == "high"
-    
-    def test_suggestion_validation(self):
-        """Test suggestion validation."""
-        repo = Repository(
-            name="test-repo",
-            full_name="user/test-repo",
-            owner="user",
-            url="https://github.com/user/test-repo",
-            default_branch="main",
-            visibility="public",
-            created_at=datetime(2024, 1, 1),
-            updated_at=datetime(2024, 11, 29)
-        )
-        
-        suggestion = MaintenanceSuggestion(
-            id="sug-001",
-            repository=repo,
-            category="bug",
-            priority="high",
-            title="Fix bug",
-            description="Bug description",
-            rationale="Bug rationale",
-            estimated_effort="medium",
-            labels=["bug"]
-        )
-        suggestion.validate()  # Should not raise
-        
-        # Test invalid category
-        suggestion.category = "invalid"
-        with pytest.raises(ValueError, match="Invalid category"):
-            suggestion.validate()
 
 
 class TestSessionState:
@@ -204,33 +88,6 @@ class TestSessionState:
         assert session.session_id == "sess-001"
         assert session.username == "testuser"
         assert len(session.repositories_analyzed) == 0
-    
-    def test_session_state_validation(self):
-        """Test session state validation."""
-        session = SessionState(
-            session_id="sess-001",
-            username="testuser"
-        )
-        session.validate()  # Should not raise
-        
-        # Test empty session_id
-        session.session_id = ""
-        with pytest.raises(ValueError, match="session_id cannot be empty"):
-            session.validate()
-    
-    def test_session_state_serialization(self):
-        """Test session state serialization."""
-        session = SessionState(
-            session_id="sess-001",
-            username="testuser",
-            repositories_analyzed=["repo1", "repo2"]
-        )
-        
-        session_dict = session.to_dict()
-        session_restored = SessionState.from_dict(session_dict)
-        assert session.session_id == session_restored.session_id
-        assert session.username == session_restored.username
-        assert session.repositories_analyzed == session_restored.repositories_analyzed
 
 
 class TestUserPreferences:
@@ -247,30 +104,6 @@ class TestUserPreferences:
         )
         assert prefs.user_id == "user123"
         assert prefs.automation_level == "manual"
-    
-    def test_user_preferences_validation(self):
-        """Test user preferences validation."""
-        prefs = UserPreferences(user_id="user123")
-        prefs.validate()  # Should not raise
-        
-        # Test invalid automation level
-        prefs.automation_level = "invalid"
-        with pytest.raises(ValueError, match="Invalid automation_level"):
-            prefs.validate()
-    
-    def test_user_preferences_serialization(self):
-        """Test user preferences serialization."""
-        prefs = UserPreferences(
-            user_id="user123",
-            automation_level="auto",
-            preferred_labels=["security"],
-            excluded_repos=[],
-            focus_areas=["security", "performance"]
-        )
-        
-        prefs_dict = prefs.to_dict()
-        prefs_restored = UserPreferences.from_dict(prefs_dict)
-        assert prefs == prefs_restored
 
 
 class TestSessionMetrics:
@@ -289,13 +122,122 @@ class TestSessionMetrics:
         )
         assert metrics.repos_analyzed == 5
         assert metrics.suggestions_generated == 10
-    
-    def test_session_metrics_validation(self):
-        """Test session metrics validation."""
-        metrics = SessionMetrics()
-        metrics.validate()  # Should not raise
+
+
+def _make_health_snapshot() -> HealthSnapshot:
+    """Build a valid health snapshot."""
+    return HealthSnapshot(
+        activity_level="active",
+        test_coverage="good",
+        documentation_quality="excellent",
+        ci_cd_status="configured",
+        dependency_status="current",
+        overall_health_score=0.9,
+        issues_identified=[]
+    )
+
+
+def _make_suggestion() -> MaintenanceSuggestion:
+    """Build a valid maintenance suggestion."""
+    return MaintenanceSuggestion(
+        id="sug-001",
+        repository=make_repository(),
+        category="bug",
+        priority="high",
+        title="Fix bug",
+        description="Bug description",
+        rationale="Bug rationale",
+        estimated_effort="medium",
+        labels=["bug"]
+    )
+
+
+def _make_session_state() -> SessionState:
+    """Build a valid session state."""
+    return SessionState(session_id="sess-001", username="testuser")
+
+
+def _make_user_preferences() -> UserPreferences:
+    """Build valid user preferences."""
+    return UserPreferences(user_id="user123")
+
+
+# (factory, field, invalid value, expected error pattern)
+INVALID_FIELD_CASES = [
+    pytest.param(make_repository, "visibility", "invalid",
+                 re.compile(r"Invalid visibility"), id="repository-visibility"),
+    pytest.param(_make_health_snapshot, "overall_health_score", 1.5,
+                 re.compile(r"must be between 0\.0 and 1\.0"), id="health-score"),
+    pytest.param(_make_suggestion, "category", "invalid",
+                 re.compile(r"Invalid category"), id="suggestion-category"),
+    pytest.param(_make_session_state, "session_id", "",
+                 re.compile(r"session_id cannot be empty"), id="session-id"),
+    pytest.param(_make_user_preferences, "automation_level", "invalid",
+                 re.compile(r"Invalid automation_level"), id="preferences-automation-level"),
+    pytest.param(SessionMetrics, "repos_analyzed", -1,
+                 re.compile(r"repos_analyzed cannot be negative"), id="metrics-repos-analyzed"),
+]
+
+
+class TestValidation:
+    """Test model validation across model types."""
+    
+    @pytest.mark.parametrize("factory,field,value,match", INVALID_FIELD_CASES)
+    def test_invalid_field(self, factory, field, value, match):
+        """Test that a valid model stops validating after one field is broken."""
+        instance = factory()
+        instance.validate()  # Should not raise
         
-        # Test negative value
-        metrics.repos_analyzed = -1
-        with pytest.raises(ValueError, match="repos_analyzed cannot be negative"):
-            metrics.validate()
+        setattr(instance, field, value)
+        with pytest.raises(ValueError, match=match):
+            instance.validate()
+
+
+SERIALIZATION_CASES = [
+    pytest.param(make_repository(), id="repository"),
+    pytest.param(
+        HealthSnapshot(
+            activity_level="moderate",
+            test_coverage="partial",
+            documentation_quality="good",
+            ci_cd_status="missing",
+            dependency_status="outdated",
+            overall_health_score=0.6,
+            issues_identified=["Missing tests", "Outdated dependencies"]
+        ),
+        id="health-snapshot",
+    ),
+    pytest.param(_make_suggestion(), id="suggestion"),
+    pytest.param(
+        SessionState(
+            session_id="sess-001",
+            username="testuser",
+            repositories_analyzed=["repo1", "repo2"]
+        ),
+        id="session-state",
+    ),
+    pytest.param(
+        UserPreferences(
+            user_id="user123",
+            automation_level="auto",
+            preferred_labels=["security"],
+            excluded_repos=[],
+            focus_areas=["security", "performance"]
+        ),
+        id="user-preferences",
+    ),
+]
+
+
+class TestSerialization:
+    """Test dict and JSON round-trips across model types."""
+    
+    @pytest.mark.parametrize("instance", SERIALIZATION_CASES)
+    def test_dict_round_trip(self, instance):
+        """Test serialization to and from a dictionary."""
+        assert type(instance).from_dict(instance.to_dict()) == instance
+    
+    @pytest.mark.parametrize("instance", SERIALIZATION_CASES)
+    def test_json_round_trip(self, instance):
+        """Test serialization to and from a JSON string."""
+        assert type(instance).from_json(instance.to_json()) == instance
@@ -2,7 +2,9 @@
 
 import pytest
 import time
+from datetime import datetime
 from src.observability import (
+    MAX_METRIC_HISTORY,
     MetricsCollector,
     get_metrics_collector,
     reset_metrics_collector,
@@ -12,6 +14,38 @@ from src.observability import (
     TokenUsageMetric
 )
 
+# Expected values for the inexact averages and rates below
+_APPROX_AVERAGE_LATENCY_MS = pytest.approx(433.33, rel=0.01)
+_APPROX_RECOVERY_RATE = pytest.approx(66.67, rel=0.01)
+_APPROX_DEFAULT_COST = pytest.approx(0.0015, rel=0.01)
+_APPROX_CUSTOM_COST = pytest.approx(0.003, rel=0.01)
+
+# Exported record and summary shapes; consumers key on these names
+_RECORD_KEYS = {
+    APICallMetric: {'service', 'endpoint', 'duration_ms', 'success', 'timestamp', 'error'},
+    AnalysisMetric: {'repository', 'duration_ms', 'success', 'timestamp', 'error'},
+    SuggestionMetric: {'repository', 'category', 'priority', 'timestamp'},
+    TokenUsageMetric: {'model', 'prompt_tokens', 'completion_tokens', 'total_tokens', 'timestamp'},
+}
+_SUMMARY_KEYS = {
+    'performance': {
+        'session_duration_seconds', 'average_analysis_duration_ms',
+        'average_github_api_latency_ms', 'average_gemini_api_latency_ms'
+    },
+    'usage': {
+        'repos_analyzed', 'suggestions_generated', 'issues_created',
+        'user_approvals', 'user_rejections', 'approval_rate_percent'
+    },
+    'quality': {
+        'error_rate_percent', 'recovery_success_rate_percent',
+        'error_counts_by_type', 'recovery_counts_by_type'
+    },
+    'cost': {
+        'total_tokens_used', 'github_api_calls', 'gemini_api_calls', 'estimated_cost_usd'
+    },
+    'breakdown': {'suggestions_by_category', 'suggestions_by_priority'},
+}
+
 
 class TestMetricsCollector:
     """Test suite for MetricsCollector class."""
@@ -82,8 +116,7 @@ class TestMetricsCollector:
         self.collector.record_api_call('gemini', 'generate_content', 1500.0, success=True)
         
         assert len(self.collector._api_call_metrics) == 2
-        assert self.collector._github_api_calls == 1
-        assert self.collector._gemini_api_calls == 1
+        assert self.collector._api_call_counts == {'github': 1, 'gemini': 1}
     
     def test_record_api_call_failure(self):
         """Test recording failed API calls."""
@@ -136,7 +169,7 @@ class TestMetricsCollector:
         
         # All services
         avg_all = self.collector.get_average_api_latency()
-        assert avg_all == pytest.approx(433.33, rel=0.01)
+        assert avg_all == _APPROX_AVERAGE_LATENCY_MS
         
         # GitHub only
         avg_github = self.collector.get_average_api_latency('github')
@@ -170,7 +203,7 @@ class TestMetricsCollector:
         
         # Recovery rate = 2 recoveries / 3 errors = 66.67%
         recovery_rate = self.collector.get_recovery_success_rate()
-        assert recovery_rate == pytest.approx(66.67, rel=0.01)
+        assert recovery_rate == _APPROX_RECOVERY_RATE
     
     def test_get_user_approval_rate(self):
         """Test calculating user approval rate."""
@@ -197,11 +230,11 @@ class TestMetricsCollector:
         
         # Default cost: $0.001 per 1k tokens
         cost = self.collector.get_estimated_cost()
-        assert cost == pytest.approx(0.0015, rel=0.01)
+        assert cost == _APPROX_DEFAULT_COST
         
         # Custom cost: $0.002 per 1k tokens
         cost_custom = self.collector.get_estimated_cost(cost_per_1k_tokens=0.002)
-        assert cost_custom == pytest.approx(0.003, rel=0.01)
+        assert cost_custom == _APPROX_CUSTOM_COST
     
     def test_get_suggestions_by_category(self):
         """Test getting suggestion counts by category."""
@@ -251,6 +284,25 @@ class TestMetricsCollector:
         assert summary['cost']['total_tokens_used'] == 1500
         assert summary['cost']['github_api_calls'] == 1
     
+    def test_session_summary_refreshes_after_new_metrics(self):
+        """Test that the cached summary is rebuilt when metrics change."""
+        self.collector.record_suggestion_generated('repo1', 'bug', 'high')
+        first = self.collector.get_session_summary()
+        first['breakdown']['suggestions_by_category']['bug'] = 99
+        
+        assert self.collector.get_session_summary() == {
+            **first,
+            'breakdown': {
+                'suggestions_by_category': {'bug': 1},
+                'suggestions_by_priority': {'high': 1},
+            },
+        }
+        
+        self.collector.record_suggestion_generated('repo1', 'bug', 'low')
+        summary = self.collector.get_session_summary()
+        assert summary['usage']['suggestions_generated'] == 2
+        assert summary['breakdown']['suggestions_by_category'] == {'bug': 2}
+    
     def test_reset(self):
         """Test resetting metrics."""
         # Add some metrics
@@ -269,21 +321,53 @@ class TestMetricsCollector:
         assert len(self.collector._suggestion_metrics) == 0
         assert len(self.collector._api_call_metrics) == 0
     
+    def test_metric_history_is_bounded(self):
+        """Test that per-event history is capped while aggregates cover every event."""
+        for i in range(MAX_METRIC_HISTORY + 1):
+            self.collector.record_analysis_duration(f'repo{i}', 1000.0, success=True)
+        
+        assert len(self.collector._analysis_metrics) == MAX_METRIC_HISTORY
+        assert self.collector._analysis_metrics[0].repository == 'repo1'
+        assert self.collector._repos_analyzed == MAX_METRIC_HISTORY + 1
+        assert self.collector.get_average_analysis_duration() == 1000.0
+    
+    def test_record_batch(self):
+        """Test recording several metrics in one call."""
+        self.collector.record_batch([
+            ('analysis', ('repo1', 1000.0)),
+            ('suggestion', ('repo1', 'bug', 'high')),
+            ('api_call', ('github', 'list_repos', 250.0, False, '404')),
+            ('token_usage', ('gemini', 1000, 500)),
+            ('error', ('github_api_error',)),
+        ])
+        
+        assert self.collector._repos_analyzed == 1
+        assert self.collector._suggestions_generated == 1
+        assert self.collector._api_call_metrics[0].error == '404'
+        assert self.collector.get_total_tokens_used() == 1500
+        assert self.collector._error_counts['github_api_error'] == 1
+    
+    def test_record_batch_rejects_unknown_kind(self):
+        """Test that a batch with an unknown event kind records nothing."""
+        with pytest.raises(ValueError, match="Unknown metric event kind"):
+            self.collector.record_batch([
+                ('suggestion', ('repo1', 'bug', 'high')),
+                ('bogus', ()),
+            ])
+        
+        assert self.collector._suggestions_generated == 0
+    
     def test_thread_safety(self):
         """Test that metrics collector is thread-safe."""
-        import threading
+        from concurrent.futures import ThreadPoolExecutor
         
-        def record_metrics():
+        def record_metrics(_):
+            record = self.collector.record_suggestion_generated
             for _ in range(100):
-                self.collector.record_suggestion_generated('repo', 'bug', 'high')
+                record('repo', 'bug', 'high')
         
-        threads = [threading.Thread(target=record_metrics) for _ in range(10)]
-        
-        for thread in threads:
-            thread.start()
-        
-        for thread in threads:
-            thread.join()
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            list(executor.map(record_metrics, range(10)))
         
         # Should have exactly 1000 suggestions (10 threads * 100 each)
         assert self.collector._suggestions_generated == 1000
@@ -326,7 +410,9 @@ class TestDataClasses:
         data = metric.to_dict()
         assert data['service'] == 'github'
         assert data['endpoint'] == 'list_repos'
-        assert 'timestamp' in data
+        assert datetime.fromisoformat(data['timestamp']).timestamp() == pytest.approx(
+            metric.timestamp_ns / 1e9, abs=1e-6
+        )
     
     def test_analysis_metric(self):
         """Test AnalysisMetric data class."""
@@ -367,8 +453,7 @@ class TestDataClasses:
         metric = TokenUsageMetric(
             model='gemini-1.5-flash',
             prompt_tokens=1000,
-            completion_tokens=500,
-            total_tokens=1500
+            completion_tokens=500
         )
         
         assert metric.model == 'gemini-1.5-flash'
@@ -381,3 +466,48 @@ class TestDataClasses:
         assert data['model'] == 'gemini-1.5-flash'
         assert data['total_tokens'] == 1500
         assert 'timestamp' in data
+    
+    @pytest.mark.parametrize('metric', [
+        APICallMetric(service='github', endpoint='list_repos', duration_ms=1.0, success=True),
+        AnalysisMetric(repository='test/repo', duration_ms=1.0, success=True),
+        SuggestionMetric(repository='test/repo', category='bug', priority='high'),
+        TokenUsageMetric(model='gemini-1.5-flash', prompt_tokens=1, completion_tokens=1),
+    ], ids=lambda metric: type(metric).__name__)
+    def test_metrics_have_no_instance_dict(self, metric):
+        """Test that metric records are slotted."""
+        assert not hasattr(metric, '__dict__')
+        with pytest.raises(AttributeError):
+            metric.note = 'ad hoc'
+    
+    @pytest.mark.parametrize('metric', [
+        APICallMetric(service='github', endpoint='list_repos', duration_ms=1.0, success=True),
+        AnalysisMetric(repository='test/repo', duration_ms=1.0, success=True),
+        SuggestionMetric(repository='test/repo', category='bug', priority='high'),
+        TokenUsageMetric(model='gemini-1.5-flash', prompt_tokens=1, completion_tokens=1),
+    ], ids=lambda metric: type(metric).__name__)
+    def test_exported_record_shape(self, metric):
+        """Test that to_dict keeps its keys and timestamp stays a datetime."""
+        data = metric.to_dict()
+        
+        assert set(data) == _RECORD_KEYS[type(metric)]
+        assert isinstance(metric.timestamp, datetime)
+        assert data['timestamp'] == metric.timestamp.isoformat()
+        assert metric.timestamp.timestamp() == pytest.approx(metric.timestamp_ns / 1e9, abs=1e-3)
+    
+    def test_token_usage_accepts_explicit_total(self):
+        """Test that callers passing total_tokens keep working."""
+        metric = TokenUsageMetric('gemini-1.5-flash', 1, 2, total_tokens=3)
+        
+        assert metric.total_tokens == 3
+        assert TokenUsageMetric('gemini-1.5-flash', 1, 2).total_tokens == 3
+    
+    def test_exported_summary_shape(self):
+        """Test that the session summary keeps its sections and keys."""
+        reset_metrics_collector()
+        collector = get_metrics_collector()
+        collector.record_api_call('github', 'list_repos', 100.0, True)
+        collector.record_token_usage('gemini-1.5-flash', 10, 20)
+        
+        summary = collector.get_session_summary()
+        
+        assert {section: set(keys) for section, keys in summary.items()} == _SUMMARY_KEYS
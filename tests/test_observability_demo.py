@@ -69,44 +69,48 @@ metrics.record_recovery('retry_api_call')
 # Get session summary
 summary = metrics.get_session_summary()
 
-# Print results
-print("\n" + "="*60)
-print("OBSERVABILITY INFRASTRUCTURE DEMO")
-print("="*60)
-
-print("\n📊 PERFORMANCE METRICS:")
-print(f"  Session Duration: {summary['performance']['session_duration_seconds']:.2f}s")
-print(f"  Avg Analysis Duration: {summary['performance']['average_analysis_duration_ms']:.2f}ms")
-print(f"  Avg GitHub API Latency: {summary['performance']['average_github_api_latency_ms']:.2f}ms")
-print(f"  Avg Gemini API Latency: {summary['performance']['average_gemini_api_latency_ms']:.2f}ms")
-
-print("\n📈 USAGE METRICS:")
-print(f"  Repositories Analyzed: {summary['usage']['repos_analyzed']}")
-print(f"  Suggestions Generated: {summary['usage']['suggestions_generated']}")
-print(f"  Issues Created: {summary['usage']['issues_created']}")
-print(f"  User Approvals: {summary['usage']['user_approvals']}")
-print(f"  User Rejections: {summary['usage']['user_rejections']}")
-print(f"  Approval Rate: {summary['usage']['approval_rate_percent']:.1f}%")
-
-print("\n✅ QUALITY METRICS:")
-print(f"  Error Rate: {summary['quality']['error_rate_percent']:.1f}%")
-print(f"  Recovery Success Rate: {summary['quality']['recovery_success_rate_percent']:.1f}%")
-print(f"  Errors by Type: {summary['quality']['error_counts_by_type']}")
-print(f"  Recoveries by Type: {summary['quality']['recovery_counts_by_type']}")
-
-print("\n💰 COST METRICS:")
-print(f"  Total Tokens Used: {summary['cost']['total_tokens_used']:,}")
-print(f"  GitHub API Calls: {summary['cost']['github_api_calls']}")
-print(f"  Gemini API Calls: {summary['cost']['gemini_api_calls']}")
-print(f"  Estimated Cost: ${summary['cost']['estimated_cost_usd']:.4f}")
-
-print("\n📋 BREAKDOWN:")
-print(f"  Suggestions by Category: {summary['breakdown']['suggestions_by_category']}")
-print(f"  Suggestions by Priority: {summary['breakdown']['suggestions_by_priority']}")
-
-print("\n" + "="*60)
-print("✅ Observability infrastructure is working correctly!")
-print("="*60)
+# Print results in a single write
+report = "\n".join([
+    "",
+    "="*60,
+    "OBSERVABILITY INFRASTRUCTURE DEMO",
+    "="*60,
+    "",
+    "📊 PERFORMANCE METRICS:",
+    f"  Session Duration: {summary['performance']['session_duration_seconds']:.2f}s",
+    f"  Avg Analysis Duration: {summary['performance']['average_analysis_duration_ms']:.2f}ms",
+    f"  Avg GitHub API Latency: {summary['performance']['average_github_api_latency_ms']:.2f}ms",
+    f"  Avg Gemini API Latency: {summary['performance']['average_gemini_api_latency_ms']:.2f}ms",
+    "",
+    "📈 USAGE METRICS:",
+    f"  Repositories Analyzed: {summary['usage']['repos_analyzed']}",
+    f"  Suggestions Generated: {summary['usage']['suggestions_generated']}",
+    f"  Issues Created: {summary['usage']['issues_created']}",
+    f"  User Approvals: {summary['usage']['user_approvals']}",
+    f"  User Rejections: {summary['usage']['user_rejections']}",
+    f"  Approval Rate: {summary['usage']['approval_rate_percent']:.1f}%",
+    "",
+    "✅ QUALITY METRICS:",
+    f"  Error Rate: {summary['quality']['error_rate_percent']:.1f}%",
+    f"  Recovery Success Rate: {summary['quality']['recovery_success_rate_percent']:.1f}%",
+    f"  Errors by Type: {summary['quality']['error_counts_by_type']}",
+    f"  Recoveries by Type: {summary['quality']['recovery_counts_by_type']}",
+    "",
+    "💰 COST METRICS:",
+    f"  Total Tokens Used: {summary['cost']['total_tokens_used']:,}",
+    f"  GitHub API Calls: {summary['cost']['github_api_calls']}",
+    f"  Gemini API Calls: {summary['cost']['gemini_api_calls']}",
+    f"  Estimated Cost: ${summary['cost']['estimated_cost_usd']:.4f}",
+    "",
+    "📋 BREAKDOWN:",
+    f"  Suggestions by Category: {summary['breakdown']['suggestions_by_category']}",
+    f"  Suggestions by Priority: {summary['breakdown']['suggestions_by_priority']}",
+    "",
+    "="*60,
+    "✅ Observability infrastructure is working correctly!",
+    "="*60,
+])
+print(report)
 
 logger.info("Observability demo complete", extra={
     'event': 'demo_complete',